@@ -1,103 +1,301 @@
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
-import subprocess
+import bisect
 import os
-import sys
+import uuid
+
+import game1
+import game2
+import game3
+import launcher
+import score_store
 
 def save_username(name):
-    # add name to Python/username.txt safely
-    os.makedirs("Python", exist_ok=True)
-    path = os.path.join("Python", "username.txt")
-
-    # read and clean existing lines
-    lines = []
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            for ln in f:
-                s = ln.rstrip("\r\n")
-                if s:
-                    # remove any accidental leading slashes
-                    s = s.lstrip("/\\")
-                lines.append(s)
-    # get list of existing names
-    usernames = []
-    for ln in lines:
-        if ":" in ln:
-            usernames.append(ln.split(":", 1)[0].strip())
-        else:
-            usernames.append(ln.strip())
-    # if name already there, rewrite cleaned file and return
-    if name in usernames:
-        # rewrite file to remove stray slashes
-        with open(path, "w", encoding="utf-8") as f:
-            for ln in lines:
-                if ln:
-                    f.write(ln + "\n")
-        return
-    # append new name (make sure last line had newline)
-    with open(path, "a", encoding="utf-8") as f:
-        if lines and not lines[-1].endswith("\n"):
-            f.write("\n")
-        f.write(f"{name}:\n")
-        
+    # register name in the score store (indexed lookup, no file rewrite)
+    score_store.register_user(name)
+
 def get_username():
     # return the most recent username if there is one
-    p = os.path.join("Python", "username.txt")
-    if os.path.exists(p):
-        with open(p, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            if lines:
-                last_line = lines[-1].strip()
-                if ":" in last_line:
-                    return last_line.split(":", 1)[0]
-                return last_line
-    return None
-
-def parse_leaderboard():
-    # read username.txt and collect scores and times
+    return score_store.last_user()
+
+def parse_leaderboard(limit=None):
+    # read the score store and collect scores and times
+    # with a limit only the best entries per game are read from the ranking index
     leaderboard = {"game1": [], "game2": [], "game3": []}
     times = {"game1": {}, "game2": {}, "game3": {}}
     grids = {"game2": {}}
     mines = {"game2": {}}
-    p = os.path.join("Python", "username.txt")
-    if os.path.exists(p):
-        with open(p, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or ":" not in line:
-                    continue
-                user, games = line.split(":", 1)
-                scores = {}
-                for pair in games.split(","):
-                    if "=" in pair:
-                        g, s = pair.split("=", 1)
-                        scores[g.strip()] = s.strip()
-                for game in ["game1", "game2", "game3"]:
-                    if game in scores:
-                        try:
-                            leaderboard[game].append((user, int(scores[game])))
-                        except ValueError:
-                            leaderboard[game].append((user, 0))
-                    time_key = f"{game}_time"
-                    if time_key in scores:
-                        times[game][user] = scores[time_key]
-                if "game2_grid" in scores:
-                    grids["game2"][user] = scores["game2_grid"]
-                if "game2_mines" in scores:
-                    mines["game2"][user] = scores["game2_mines"]
+    if limit is None:
+        users = score_store.all_users()
+    else:
+        top = {}
+        for game in leaderboard:
+            top.update(score_store.top_scores(game, limit))
+        users = top.items()
+    data = (leaderboard, times, grids, mines)
+    for user, scores in users:
+        add_user_scores(data, user, scores)
+    sort_leaderboard(data, limit)
+    return data
+
+def add_user_scores(data, user, scores):
+    # put one user's scores into the (leaderboard, times, grids, mines) tuple
+    leaderboard, times, grids, mines = data
+    for game in ["game1", "game2", "game3"]:
+        if game in scores:
+            leaderboard[game].append((user, scores[game]))
+        time_key = f"{game}_time"
+        if time_key in scores:
+            times[game][user] = str(scores[time_key])
+    if "game2_grid" in scores:
+        grids["game2"][user] = str(scores["game2_grid"])
+    if "game2_mines" in scores:
+        mines["game2"][user] = str(scores["game2_mines"])
+
+def get_user_scores(data, user, ranked):
+    # pull one user's scores back out of the tuple, ranked holds their leaderboard scores by game
+    leaderboard, times, grids, mines = data
+    scores = dict(ranked)
+    for game in ["game1", "game2", "game3"]:
+        if user in times[game]:
+            scores[f"{game}_time"] = int(times[game][user])
+    if user in grids["game2"]:
+        scores["game2_grid"] = int(grids["game2"][user])
+    if user in mines["game2"]:
+        scores["game2_mines"] = int(mines["game2"][user])
+    return scores
+
+def sort_leaderboard(data, limit=None):
+    # sort each game's list best first, cut to limit if given
+    leaderboard = data[0]
     for game in leaderboard:
         leaderboard[game].sort(key=lambda x: x[1], reverse=True)
-    return leaderboard, times, grids, mines
+        if limit is not None:
+            leaderboard[game] = leaderboard[game][:limit]
+
+class LeaderboardCache:
+    # keep parsed leaderboards until scores.db or the journal changes on disk
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.partial = 0
+
+    def file_state(self, path):
+        # (mtime, size, inode) of a file, None if missing
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def get(self, limit=None):
+        # return cached tuple, re-read only new journal lines when possible
+        db_state = self.file_state(score_store.DB_FILE)
+        compacting_state = self.file_state(score_store.COMPACTING_FILE)
+        journal_state = self.file_state(score_store.JOURNAL_FILE)
+        entry = self.entries.get(limit)
+        if entry and entry["db"] == db_state and entry["compacting"] == compacting_state:
+            if entry["journal"] == journal_state:
+                self.hits += 1
+                return entry["data"]
+            old = entry["journal"]
+            if journal_state and (old is None or (old[2] == journal_state[2] and old[1] <= journal_state[1])):
+                # only new lines were added to the journal, apply just those
+                records, entry["offset"] = score_store.read_journal(score_store.JOURNAL_FILE, entry["offset"])
+                self.apply(entry["data"], records, limit, entry["index"])
+                entry["journal"] = journal_state
+                self.partial += 1
+                return entry["data"]
+        self.misses += 1
+        offset = score_store.read_journal(score_store.JOURNAL_FILE)[1] if journal_state else 0
+        data = parse_leaderboard(limit)
+        self.entries[limit] = {
+            "db": db_state,
+            "compacting": compacting_state,
+            "journal": journal_state,
+            "offset": offset,
+            "data": data,
+            "index": {game: dict(entries) for game, entries in data[0].items()},
+        }
+        return data
+
+    def apply(self, data, records, limit, index):
+        # merge journal records into a cached tuple. index holds name -> score for every
+        # list, so a changed user's old entry is found by bisecting for that score and
+        # the new entry goes in at its sorted place, no pass over the whole list
+        leaderboard = data[0]
+        changed = {}
+        for user, record in records:
+            changed[user] = score_store.merge_result(changed.get(user, {}), record)
+        added = ({game: [] for game in leaderboard},) + data[1:]
+        for user, record in changed.items():
+            ranked = {}
+            for game, board in leaderboard.items():
+                old = index[game].pop(user, None)
+                if old is not None:
+                    ranked[game] = old
+                    # lists are best first, so search on the negated score
+                    i = bisect.bisect_left(board, -old, key=lambda e: -e[1])
+                    while board[i][0] != user:
+                        i += 1
+                    del board[i]
+            scores = score_store.merge_result(get_user_scores(data, user, ranked), record)
+            add_user_scores(added, user, scores)
+        for game, entries in added[0].items():
+            board = leaderboard[game]
+            for entry in entries:
+                board.insert(bisect.bisect_right(board, -entry[1], key=lambda e: -e[1]), entry)
+                index[game][entry[0]] = entry[1]
+            if limit is not None:
+                # the limited entry only ever needs its top k
+                for name, _ in board[limit:]:
+                    del index[game][name]
+                del board[limit:]
+
+    def stats_text(self):
+        return f"cache hits: {self.hits} | misses: {self.misses} | partial: {self.partial}"
+
+leaderboard_cache = LeaderboardCache()
+
+class RankingView:
+    # virtual list: the tree only holds the visible rows, and every scroll reads just
+    # that page from the game's ranking index (ORDER BY ... LIMIT/OFFSET in score_store)
+    def __init__(self, master, game, columns, make_row, sortable=(0,), visible=15):
+        self.game = game
+        self.make_row = make_row
+        self.columns = columns
+        self.visible = visible
+        self.count = score_store.ranking_count(game)
+        self.top = 0
+        self.reverse = False
+
+        search = tk.Frame(master)
+        search.pack(fill="x", padx=6, pady=4)
+        tk.Label(search, text="Player:").pack(side="left")
+        self.search_var = tk.StringVar(value=current_user or "")
+        entry = tk.Entry(search, textvariable=self.search_var, width=16)
+        entry.pack(side="left", padx=4)
+        entry.bind("<Return>", lambda e: self.find(self.search_var.get().strip()))
+        tk.Button(search, text="Find", command=lambda: self.find(self.search_var.get().strip())).pack(side="left")
+        tk.Label(search, text=f"{self.count} players").pack(side="right")
+
+        body = tk.Frame(master)
+        body.pack(fill="both", expand=True, padx=6, pady=4)
+        self.tree = ttk.Treeview(body, columns=columns, show="headings", height=visible, selectmode="browse")
+        for i, col in enumerate(columns):
+            # only the ranked columns sort (both ways along the index), others would need a full sort
+            if i in sortable:
+                self.tree.heading(col, text=col, command=self.flip)
+            else:
+                self.tree.heading(col, text=col)
+            self.tree.column(col, width=60 if i != 1 else 120, anchor="w")
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self.on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.items = [self.tree.insert("", "end", values=()) for _ in range(visible)]
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self.on_wheel)
+        self.render()
+
+    def render(self):
+        # read and show the visible page only
+        n = self.count
+        page = score_store.ranking_page(self.game, self.top, self.visible, self.reverse)
+        for i, iid in enumerate(self.items):
+            if i < len(page):
+                pos = self.top + i
+                rank = n - pos if self.reverse else pos + 1
+                self.tree.item(iid, values=self.make_row(rank, *page[i]))
+            else:
+                self.tree.item(iid, values=())
+        if n:
+            self.scrollbar.set(self.top / n, min(1.0, (self.top + self.visible) / n))
+        else:
+            self.scrollbar.set(0, 1)
+
+    def scroll_to(self, top):
+        self.top = max(0, min(top, self.count - self.visible))
+        self.render()
+
+    def on_scroll(self, *args):
+        # scrollbar callback: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * self.count))
+        elif args[0] == "scroll":
+            step = self.visible if args[2] == "pages" else 1
+            self.scroll_to(self.top + int(args[1]) * step)
+
+    def on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self.top - 3)
+        else:
+            self.scroll_to(self.top + 3)
+        return "break"
+
+    def flip(self):
+        # best first <-> worst first
+        self.reverse = not self.reverse
+        self.scroll_to(0)
+
+    def find(self, name):
+        # jump to a player's row and select it, the position comes from a COUNT(*) on the index
+        pos = score_store.ranking_position(self.game, name, self.reverse)
+        if pos is None:
+            messagebox.showinfo("Leaderboard", f"{name} is not on this leaderboard.")
+            return
+        self.scroll_to(pos)
+        self.tree.selection_set(self.items[pos - self.top])
+
+def open_full_ranking():
+    # show every player for each game in virtual lists paged from the score store
+    win = tk.Toplevel(root)
+    win.title("Full Ranking")
+    win.geometry("460x420")
+    notebook = ttk.Notebook(win)
+    notebook.pack(fill="both", expand=True)
+
+    frame1 = tk.Frame(notebook)
+    notebook.add(frame1, text="Blinding Fear")
+    RankingView(
+        frame1,
+        "game1",
+        ("Rank", "Player", "Score", "Time"),
+        lambda rank, name, s: (rank, name, s["game1"], s.get("game1_time", "N/A")),
+        sortable=(0, 2),
+    )
+
+    frame2 = tk.Frame(notebook)
+    notebook.add(frame2, text="Minesweeper")
+    RankingView(
+        frame2,
+        "game2",
+        ("Rank", "Player", "Time", "Grid", "Mines"),
+        lambda rank, name, s: (rank, name, s["game2_time"], s.get("game2_grid", "N/A"), s.get("game2_mines", "N/A")),
+        sortable=(0, 2),
+    )
+
+    frame3 = tk.Frame(notebook)
+    notebook.add(frame3, text="Snake")
+    RankingView(
+        frame3,
+        "game3",
+        ("Rank", "Player", "Score", "Time"),
+        lambda rank, name, s: (rank, name, s["game3"], s.get("game3_time", "N/A")),
+        sortable=(0, 2),
+    )
 
 def open_leaderboard():
     # show the leaderboard window
     leaderboard_win = tk.Toplevel(root)
     leaderboard_win.title("Leaderboard")
     leaderboard_win.geometry("400x350")
+    leaderboard, times, grids, mines = leaderboard_cache.get(limit=10)
+    tk.Label(leaderboard_win, text=leaderboard_cache.stats_text(), font=("Arial", 8), fg="grey").pack(side="bottom")
+    tk.Button(leaderboard_win, text="Full Ranking", command=open_full_ranking).pack(side="bottom", pady=4)
     notebook = ttk.Notebook(leaderboard_win)
     notebook.pack(fill="both", expand=True)
-    leaderboard, times, grids, mines = parse_leaderboard()
     # Game 1 tab
     frame1 = tk.Frame(notebook)
     notebook.add(frame1, text="Blinding Fear")
@@ -143,18 +341,51 @@ def open_leaderboard():
     else:
         tk.Label(frame3, text="No scores yet.", font=("Arial", 12)).pack(pady=20)
 
-def launch_game(filename):
-    # run another python file using same interpreter
-    try:
-        subprocess.Popen([sys.executable, filename])
-    except Exception:
-        # fallback to plain call
-        subprocess.Popen(["python", filename])
+def launch_game(game):
+    # start a game inside this window, or through the warm worker / a new python
+    if play_in_menu_var.get():
+        mount_game(game)
+    else:
+        launcher.launch(game, current_user or "", current_session)
+
+def mount_game(game):
+    # run a game as a frame in this window, sharing this Tk and score store
+    user = current_user or ""
+    if game == "game2":
+        try:
+            game2.GRID_SIZE, game2.NUM_MINES = game2.get_game_settings(root)
+        except SystemExit:
+            return
+    for w in root.winfo_children():
+        w.destroy()
+    frame = tk.Frame(root, bg="black" if game == "game1" else None)
+    frame.pack(fill="both", expand=True)
+    if game == "game1":
+        root.title("Blinding Fear")
+        root.geometry(f"{game1.WIDTH}x{game1.HEIGHT}")
+        game1.BlindingFear(frame, user, on_exit=back_to_menu)
+    elif game == "game2":
+        root.title("Minesweeper")
+        game2.MineSweeper(frame, user, on_exit=back_to_menu)
+    else:
+        game3.SnakeGame(frame, initial_username=user, on_exit=back_to_menu)
+
+def back_to_menu():
+    # a mounted game finished, put the menu back
+    root.title("Main Menu")
+    root.geometry("400x300")
+    root.resizable(True, True)
+    show_main_menu(current_user)
 
 # --- New startup flow: entry screen before showing main menu ---
+current_user = None
+current_session = ""
 root = tk.Tk()
 root.title("Main Menu")
 root.geometry("400x300")
+# load tkinter and the games in the background so launches are quick
+launcher.start_worker()
+play_in_menu_var = tk.BooleanVar(value=False)
 
 def write_active_name(name):
     # save active name to Python/name.txt
@@ -172,21 +403,25 @@ def show_main_menu(username):
     frame.pack(pady=30)
     btn1 = tk.Button(frame, text="Leaderboard", width=20, height=3, command=open_leaderboard)
     btn1.grid(row=0, column=0, padx=10, pady=10)
-    btn2 = tk.Button(frame, text="Blinding Fear", width=20, height=3, command=lambda: launch_game("Python\\game1.py"))
+    btn2 = tk.Button(frame, text="Blinding Fear", width=20, height=3, command=lambda: launch_game("game1"))
     btn2.grid(row=0, column=1, padx=10, pady=10)
-    btn3 = tk.Button(frame, text="Minesweeper", width=20, height=3, command=lambda: launch_game("Python\\game2.py"))
+    btn3 = tk.Button(frame, text="Minesweeper", width=20, height=3, command=lambda: launch_game("game2"))
     btn3.grid(row=1, column=0, padx=10, pady=10)
-    btn4 = tk.Button(frame, text="Snake", width=20, height=3, command=lambda: launch_game("Python\\game3.py"))
+    btn4 = tk.Button(frame, text="Snake", width=20, height=3, command=lambda: launch_game("game3"))
     btn4.grid(row=1, column=1, padx=10, pady=10)
+    tk.Checkbutton(root, text="Play inside this window", variable=play_in_menu_var).pack()
 
 def on_start_continue(entry_widget):
     # save name and go to main menu
+    global current_user, current_session
     name = entry_widget.get().strip()
     if not name:
         messagebox.showerror("Error", "Please enter a name.")
         return
     save_username(name)
     write_active_name(name)
+    current_user = name
+    current_session = uuid.uuid4().hex[:12]
     show_main_menu(name)
 
 # initial name entry screen (no popup)
@@ -0,0 +1,187 @@
+import random
+import time
+
+from scene import Scene
+
+
+class Camera:
+    # top left corner of the window in level coordinates, kept centred on the
+    # player and inside the level
+    def __init__(self, view_w, view_h, level_w, level_h):
+        self.view_w = view_w
+        self.view_h = view_h
+        self.level_w = max(level_w, view_w)
+        self.level_h = max(level_h, view_h)
+        self.x = 0
+        self.y = 0
+
+    def follow(self, x, y):
+        # returns True if the view moved
+        nx = min(max(int(x - self.view_w / 2), 0), self.level_w - self.view_w)
+        ny = min(max(int(y - self.view_h / 2), 0), self.level_h - self.view_h)
+        if (nx, ny) == (self.x, self.y):
+            return False
+        self.x, self.y = nx, ny
+        return True
+
+    def rect(self, margin=0):
+        return (self.x - margin, self.y - margin, self.x + self.view_w + margin, self.y + self.view_h + margin)
+
+
+class CulledLayer:
+    # level objects (id -> box) filed by chunk. only objects in chunks around the view
+    # get a canvas item, items come from a pool and go back to it hidden, so the number
+    # of items depends on the window size, not on the level size.
+    # new items land on top of the canvas, below (a tag) puts them back under the entities
+    def __init__(self, scene, chunk, make, below=None):
+        self.scene = scene
+        self.chunk = chunk
+        self.make = make  # make(box) -> new canvas item
+        self.below = below
+        self.boxes = {}
+        self.chunks = {}
+        self.live = {}
+        self.pool = []
+        self.range = None
+        self.created = 0
+
+    def _span(self, box):
+        c = self.chunk
+        return int(box[0] // c), int(box[1] // c), int(box[2] // c), int(box[3] // c)
+
+    def _file(self, oid, box, add):
+        c0, r0, c1, r1 = self._span(box)
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                if add:
+                    self.chunks.setdefault((col, row), set()).add(oid)
+                else:
+                    self.chunks[(col, row)].discard(oid)
+
+    def _in_range(self, box):
+        if self.range is None:
+            return False
+        c0, r0, c1, r1 = self._span(box)
+        v0, w0, v1, w1 = self.range
+        return c0 <= v1 and v0 <= c1 and r0 <= w1 and w0 <= r1
+
+    def add(self, oid, box):
+        self.boxes[oid] = box
+        self._file(oid, box, True)
+        if self._in_range(box):
+            self._acquire(oid)
+
+    def move(self, oid, box):
+        self._file(oid, self.boxes[oid], False)
+        self.boxes[oid] = box
+        self._file(oid, box, True)
+        if self._in_range(box):
+            if oid in self.live:
+                self.scene.move(self.live[oid], box)
+            else:
+                self._acquire(oid)
+        elif oid in self.live:
+            self._release(oid)
+
+    def refresh(self, view):
+        # materialise the objects in chunks the view touches, hide the rest
+        # (nothing to do until the view crosses into another chunk)
+        span = self._span(view)
+        if span == self.range:
+            return
+        self.range = span
+        c0, r0, c1, r1 = span
+        wanted = set()
+        chunks = self.chunks
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                ids = chunks.get((col, row))
+                if ids:
+                    wanted |= ids
+        for oid in [oid for oid in self.live if oid not in wanted]:
+            self._release(oid)
+        for oid in wanted:
+            if oid not in self.live:
+                self._acquire(oid)
+
+    def _acquire(self, oid):
+        box = self.boxes[oid]
+        if self.pool:
+            item = self.pool.pop()
+            self.scene.move(item, box)
+            self.scene.show(item, True)
+        else:
+            item = self.make(box)
+            if self.below:
+                self.scene.lower(item, self.below)
+            self.created += 1
+        self.live[oid] = item
+
+    def _release(self, oid):
+        item = self.live.pop(oid)
+        self.scene.show(item, False)
+        self.pool.append(item)
+
+
+class _CountingCanvas:
+    # stands in for a tk.Canvas when there is no display
+    def __init__(self):
+        self.last = 0
+
+    def _new(self, *args, **kwargs):
+        self.last += 1
+        return self.last
+
+    create_rectangle = create_oval = create_image = _new
+
+    def coords(self, *args):
+        pass
+
+    def itemconfig(self, *args, **kwargs):
+        pass
+
+    def tag_lower(self, item, below):
+        pass
+
+    def xview_moveto(self, fraction):
+        pass
+
+    def yview_moveto(self, fraction):
+        pass
+
+
+def benchmark(levels=(1000, 4000, 16000), view=1000, cell=79, frames=2000):
+    # items and Tk calls while the camera roams levels of growing size
+    from collision import merge_walls
+    from maze import generate, maze_walls
+    for size in levels:
+        walls = merge_walls(maze_walls(generate(size // cell, size // cell, 1), cell, 7, 25, random.Random(1)))
+        scene = Scene(_CountingCanvas())
+        layer = CulledLayer(scene, cell * 4, lambda box: scene.rect(*box, "#000000", "wall"))
+        for i, box in enumerate(walls):
+            layer.add(i, box)
+        cam = Camera(view, view, size, size)
+        rnd = random.Random(2)
+        x = y = size / 2
+        cam.follow(x, y)
+        layer.refresh(cam.rect(cell))
+        most = len(layer.live)
+        start = time.perf_counter()
+        for f in range(frames):
+            # wander about, a new heading every second
+            if f % 60 == 0:
+                dx, dy = rnd.choice(((4.1, 0), (-4.1, 0), (0, 4.1), (0, -4.1)))
+            x = min(max(x + dx, 0), size)
+            y = min(max(y + dy, 0), size)
+            if cam.follow(x, y):
+                scene.view(cam.x, cam.y, size, size)
+                layer.refresh(cam.rect(cell))
+            most = max(most, len(layer.live))
+            scene.end_frame()
+        ms = (time.perf_counter() - start) * 1000 / frames
+        print(f"level {size:>5}px, {len(walls):>6} walls: at most {most} live, {layer.created} items made, "
+              f"{scene.tk_calls / frames:.1f} Tk calls and {ms:.3f} ms per frame")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,188 @@
+import random
+import time
+
+
+class WallIndex:
+    # uniform grid over the wall rectangles so a point only checks walls in its own bucket
+    # every rect is stored inflated by pad, in every bucket the inflated rect covers
+    def __init__(self, rects, pad, bucket):
+        self.pad = pad
+        self.bucket = bucket
+        self.buckets = {}
+        for x1, y1, x2, y2 in rects:
+            self.add((x1 - pad, y1 - pad, x2 + pad, y2 + pad))
+
+    def add(self, rect):
+        x1, y1, x2, y2 = rect
+        b = self.bucket
+        for bx in range(int(x1 // b), int(x2 // b) + 1):
+            for by in range(int(y1 // b), int(y2 // b) + 1):
+                self.buckets.setdefault((bx, by), []).append(rect)
+
+    def hit(self, x, y):
+        # True if (x, y) is strictly inside any inflated wall
+        b = self.bucket
+        for x1, y1, x2, y2 in self.buckets.get((int(x // b), int(y // b)), ()):
+            if x1 < x < x2 and y1 < y < y2:
+                return True
+        return False
+
+    def segment_open(self, x1, y1, x2, y2):
+        # True if a stretch (over 1 px) of the horizontal or vertical segment from
+        # (x1, y1) to (x2, y2) is clear of every inflated wall, e.g. a way through a cell side
+        vertical = x1 == x2
+        lo, hi = (y1, y2) if vertical else (x1, x2)
+        b = self.bucket
+        blocked = []
+        for bx in range(int(x1 // b), int(x2 // b) + 1):
+            for by in range(int(y1 // b), int(y2 // b) + 1):
+                for rx1, ry1, rx2, ry2 in self.buckets.get((bx, by), ()):
+                    if vertical and rx1 < x1 < rx2:
+                        blocked.append((ry1, ry2))
+                    elif not vertical and ry1 < y1 < ry2:
+                        blocked.append((rx1, rx2))
+        blocked.sort()
+        pos = lo
+        for start, end in blocked:
+            if min(start, hi) - pos > 1:
+                return True
+            pos = max(pos, end)
+            if pos >= hi:
+                return False
+        return hi - pos > 1
+
+
+def _fuse(rects, lo, hi):
+    # join rects that share the same span on one axis and touch or overlap on the other
+    # lo/hi pick the coordinates along the fusing axis (0, 2 for x or 1, 3 for y)
+    groups = {}
+    for rect in rects:
+        key = (rect[1], rect[3]) if lo == 0 else (rect[0], rect[2])
+        groups.setdefault(key, []).append(rect)
+    out = []
+    for group in groups.values():
+        group.sort(key=lambda r: r[lo])
+        cur = list(group[0])
+        for rect in group[1:]:
+            if rect[lo] <= cur[hi]:
+                cur[hi] = max(cur[hi], rect[hi])
+            else:
+                out.append(tuple(cur))
+                cur = list(rect)
+        out.append(tuple(cur))
+    return out
+
+
+def merge_walls(rects):
+    # same covered area in fewer rectangles: drop duplicate pieces, then fuse
+    # collinear runs along x and y until nothing changes, gaps stay open.
+    # zero width pieces (a gap at the very end of a side) are kept, once
+    # inflated by the player radius they still block
+    merged = list(set(rects))
+    count = None
+    while count != len(merged):
+        count = len(merged)
+        merged = _fuse(_fuse(merged, 0, 2), 1, 3)
+    return sorted(merged)
+
+
+def linear_hit(rects, pad, x, y):
+    # the old full scan, kept for the benchmark
+    for x1, y1, x2, y2 in rects:
+        if x1 - pad < x < x2 + pad and y1 - pad < y < y2 + pad:
+            return True
+    return False
+
+
+def grid_walls(cols, rows, cell=79, thickness=7, gap=25, seed=1):
+    # every cell side as a wall with a door in it, a worst case for the wall count
+    rnd = random.Random(seed)
+    rects = []
+    for row in range(rows):
+        for col in range(cols):
+            x1, y1 = col * cell, row * cell
+            x2, y2 = x1 + cell, y1 + cell
+            mid = (cell - gap) // rnd.randint(1, 9)
+            rects.append((x1, y1, x1 + mid, y1 + thickness))
+            rects.append((x1 + mid + gap, y1, x2, y1 + thickness))
+            mid = (cell - gap) // rnd.randint(1, 9)
+            rects.append((x1, y1, x1 + thickness, y1 + mid))
+            rects.append((x1, y1 + mid + gap, x1 + thickness, y2))
+    return rects
+
+
+def benchmark(sizes=(12, 200), queries=20000, cell=79, pad=6):
+    # time will_collide style queries, linear scan vs the grid index
+    for size in sizes:
+        rects = grid_walls(size, size, cell)
+        index = WallIndex(rects, pad, cell)
+        rnd = random.Random(2)
+        span = size * cell
+        points = [(rnd.uniform(0, span), rnd.uniform(0, span)) for _ in range(queries)]
+        # the linear scan is very slow on big mazes, so it gets fewer queries there
+        lin_points = points[: max(200, queries // size)]
+        start = time.perf_counter()
+        for x, y in lin_points:
+            linear_hit(rects, pad, x, y)
+        lin_us = (time.perf_counter() - start) * 1e6 / len(lin_points)
+        start = time.perf_counter()
+        for x, y in points:
+            index.hit(x, y)
+        idx_us = (time.perf_counter() - start) * 1e6 / len(points)
+        assert all(index.hit(x, y) == linear_hit(rects, pad, x, y) for x, y in lin_points)
+        print(f"{size}x{size} maze, {len(rects)} walls: linear {lin_us:8.2f} us, indexed {idx_us:6.2f} us per query")
+
+
+def benchmark_merge(sizes=(12, 200), queries=20000, cell=79, pad=6):
+    # wall counts before and after merging, and what that saves for collision and drawing
+    from maze import generate, maze_walls
+    for size in sizes:
+        rects = maze_walls(generate(size, size, 1), cell, 7, 25, random.Random(1))
+        start = time.perf_counter()
+        merged = merge_walls(rects)
+        merge_ms = (time.perf_counter() - start) * 1000
+        rnd = random.Random(2)
+        span = size * cell
+        points = [(rnd.uniform(0, span), rnd.uniform(0, span)) for _ in range(queries)]
+        results = []
+        for walls in (rects, merged):
+            index = WallIndex(walls, pad, cell)
+            start = time.perf_counter()
+            for x, y in points:
+                index.hit(x, y)
+            results.append((time.perf_counter() - start) * 1e6 / len(points))
+            if size <= 12:
+                lin_points = points[:2000]
+                start = time.perf_counter()
+                for x, y in lin_points:
+                    linear_hit(walls, pad, x, y)
+                results.append((time.perf_counter() - start) * 1e6 / len(lin_points))
+        index = WallIndex(merged, pad, cell)
+        assert all(index.hit(x, y) == linear_hit(rects, pad, x, y) for x, y in points[:2000])
+        print(f"{size}x{size} maze: {len(rects)} walls -> {len(merged)} after merging ({merge_ms:.1f} ms)")
+        print(f"  indexed query {results[0]:.2f} -> {results[len(results) // 2]:.2f} us")
+        if size <= 12:
+            print(f"  linear query  {results[1]:.2f} -> {results[3]:.2f} us")
+        print(f"  canvas items  {len(rects)} -> {len(merged)}, startup draw {_draw_ms(rects):s} -> {_draw_ms(merged):s}")
+
+
+def _draw_ms(rects):
+    # time creating the wall items on a real canvas, if there is a display
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return "n/a"
+    canvas = tk.Canvas(root)
+    start = time.perf_counter()
+    for x1, y1, x2, y2 in rects:
+        canvas.create_rectangle(x1, y1, x2, y2, fill="#000000", outline="")
+    root.update()
+    ms = (time.perf_counter() - start) * 1000
+    root.destroy()
+    return f"{ms:.1f} ms"
+
+
+if __name__ == "__main__":
+    benchmark()
+    benchmark_merge()
@@ -0,0 +1,158 @@
+import math
+import random
+import time
+from array import array
+
+
+class Pickups:
+    # things that sit still until collected (blobs). positions live in flat arrays
+    # indexed by id, and every id is also filed in a uniform grid bucket so a pickup
+    # check only looks at the few buckets around the player, however many there are
+    def __init__(self, radius, bucket):
+        self.radius = radius
+        self.bucket = bucket
+        self.xs = array("d")
+        self.ys = array("d")
+        self.grid = {}
+
+    def __len__(self):
+        return len(self.xs)
+
+    def _key(self, x, y):
+        b = self.bucket
+        return int(x // b), int(y // b)
+
+    def add(self, x, y):
+        i = len(self.xs)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.grid.setdefault(self._key(x, y), []).append(i)
+        return i
+
+    def move(self, i, x, y):
+        # respawning a pickup moves it, so ids (and whatever draws them) stay put
+        old = self._key(self.xs[i], self.ys[i])
+        new = self._key(x, y)
+        if old != new:
+            self.grid[old].remove(i)
+            if not self.grid[old]:
+                del self.grid[old]
+            self.grid.setdefault(new, []).append(i)
+        self.xs[i] = x
+        self.ys[i] = y
+
+    def hits(self, x, y, r):
+        # ids whose circle touches a circle of radius r at (x, y)
+        reach = r + self.radius
+        reach2 = reach * reach
+        b = self.bucket
+        xs, ys, grid = self.xs, self.ys, self.grid
+        found = []
+        for bx in range(int((x - reach) // b), int((x + reach) // b) + 1):
+            for by in range(int((y - reach) // b), int((y + reach) // b) + 1):
+                for i in grid.get((bx, by), ()):
+                    dx = xs[i] - x
+                    dy = ys[i] - y
+                    if dx * dx + dy * dy <= reach2:
+                        found.append(i)
+        return found
+
+    def position(self, i):
+        return self.xs[i], self.ys[i]
+
+
+class Movers:
+    # things that move every step (chasers, orbs): position and velocity buffers,
+    # a pass that sets every velocity, then one pass that integrates them all
+    def __init__(self):
+        self.xs = array("d")
+        self.ys = array("d")
+        self.vxs = array("d")
+        self.vys = array("d")
+
+    def __len__(self):
+        return len(self.xs)
+
+    def add(self, x, y):
+        self.xs.append(x)
+        self.ys.append(y)
+        self.vxs.append(0.0)
+        self.vys.append(0.0)
+        return len(self.xs) - 1
+
+    def position(self, i):
+        return self.xs[i], self.ys[i]
+
+    def place(self, i, x, y):
+        self.xs[i] = x
+        self.ys[i] = y
+
+    def aim(self, targets, speed, *args):
+        # targets(x, y, *args) -> point each mover heads for this step, at most speed px
+        xs, ys, vxs, vys = self.xs, self.ys, self.vxs, self.vys
+        hypot = math.hypot
+        for i in range(len(xs)):
+            x = xs[i]
+            y = ys[i]
+            tx, ty = targets(x, y, *args)
+            dx = tx - x
+            dy = ty - y
+            dist = hypot(dx, dy)
+            if dist > speed:
+                vxs[i] = dx * speed / dist
+                vys[i] = dy * speed / dist
+            else:
+                vxs[i] = dx
+                vys[i] = dy
+
+    def integrate(self):
+        xs, ys, vxs, vys = self.xs, self.ys, self.vxs, self.vys
+        for i in range(len(xs)):
+            xs[i] += vxs[i]
+            ys[i] += vys[i]
+
+    def touching(self, x, y, reach):
+        # first mover within reach of (x, y), or -1
+        reach2 = reach * reach
+        xs, ys = self.xs, self.ys
+        for i in range(len(xs)):
+            dx = xs[i] - x
+            dy = ys[i] - y
+            if dx * dx + dy * dy <= reach2:
+                return i
+        return -1
+
+
+def benchmark(counts=(4, 1000, 10000), size=4000, frames=600, chasers=100):
+    # per frame cost of pickups (broadphase + respawns) and chaser movement, the
+    # player sweeping across a size x size field full of pickups
+    rnd = random.Random(1)
+    for n in counts:
+        pickups = Pickups(6, 24)
+        for _ in range(n):
+            pickups.add(rnd.uniform(0, size), rnd.uniform(0, size))
+        movers = Movers()
+        for _ in range(chasers):
+            movers.add(rnd.uniform(0, size), rnd.uniform(0, size))
+        x, y = 0.0, size / 2
+        collected = 0
+        pick_s = move_s = 0.0
+        for f in range(frames):
+            x = (x + 4.1) % size
+            y = size / 2 + math.sin(f / 30) * 200
+            t0 = time.perf_counter()
+            for i in pickups.hits(x, y, 6):
+                pickups.move(i, rnd.uniform(0, size), rnd.uniform(0, size))
+                collected += 1
+            t1 = time.perf_counter()
+            movers.aim(lambda mx, my: (x, y), 3.5)
+            movers.integrate()
+            t2 = time.perf_counter()
+            pick_s += t1 - t0
+            move_s += t2 - t1
+        print(f"{n:>6} pickups: {pick_s * 1000 / frames:.4f} ms pickups, "
+              f"{move_s * 1000 / frames:.3f} ms for {chasers} chasers per frame ({collected} collected)")
+
+
+if __name__ == "__main__":
+    benchmark()
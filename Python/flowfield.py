@@ -0,0 +1,175 @@
+import math
+import random
+import time
+from array import array
+from collections import deque
+
+from maze import RIGHT, BOTTOM
+
+
+# cells a field rebuild visits per update call, so one rebuild is spread over a few frames
+BUDGET = 5000
+
+
+class FlowField:
+    # for every maze cell the neighbour one step closer to the target cell (BFS over
+    # the passages). it only changes when the target changes cell, and any number of
+    # chasers look up their next cell in O(1).
+    # with walls (a collision.WallIndex) two cells are linked wherever the player can
+    # really cross their shared side, gaps cut into closed maze walls included, so the
+    # graph has loops. a rebuild runs at most budget cells per update call, chasers
+    # keep following the last finished field until the new one is done
+    def __init__(self, maze, cell, walls=None, budget=BUDGET):
+        self.maze = maze
+        self.cell = cell
+        self.cols = maze.cols
+        self.rows = maze.rows
+        self.budget = budget
+        count = maze.cols * maze.rows
+        self.blank = array("i", [-1]) * count
+        self.next = array("i", self.blank)
+        self.target = -1
+        self.rebuilds = 0
+        # the rebuild in progress: its target, field and queue (None when idle)
+        self.pending = -1
+        self.work = None
+        self.queue = None
+        cols = self.cols
+        self.links = [[] for _ in range(count)]
+        for y in range(self.rows):
+            for x in range(cols):
+                i = y * cols + x
+                if walls is None:
+                    right = x + 1 < cols and not maze.walls(x, y) & RIGHT
+                    down = y + 1 < self.rows and not maze.walls(x, y) & BOTTOM
+                else:
+                    x2, y2 = (x + 1) * cell, (y + 1) * cell
+                    right = x + 1 < cols and walls.segment_open(x2, y * cell, x2, y2)
+                    down = y + 1 < self.rows and walls.segment_open(x * cell, y2, x2, y2)
+                if right:
+                    self.links[i].append(i + 1)
+                    self.links[i + 1].append(i)
+                if down:
+                    self.links[i].append(i + cols)
+                    self.links[i + cols].append(i)
+        self.links = [tuple(links) for links in self.links]
+
+    def cell_of(self, x, y):
+        cols = self.cols
+        col = int(x // self.cell)
+        row = int(y // self.cell)
+        if not (0 <= col < cols and 0 <= row < self.rows):
+            # past the last full cell (the window is rarely a whole number of cells)
+            col = min(max(col, 0), cols - 1)
+            row = min(max(row, 0), self.rows - 1)
+        return row * cols + col
+
+    def center(self, i):
+        row, col = divmod(i, self.cols)
+        return (col + 0.5) * self.cell, (row + 0.5) * self.cell
+
+    def update(self, x, y, budget=None):
+        # carry on with the rebuild in progress, or start one if (x, y) is in another cell
+        # than the finished field's target. returns True when a new field is finished.
+        # budget 0 runs the whole rebuild now
+        if self.work is None:
+            target = self.cell_of(x, y)
+            if target == self.target:
+                return False
+            self.rebuilds += 1
+            self.pending = target
+            self.work = array("i", self.blank)
+            self.work[target] = target
+            self.queue = deque([target])
+        budget = self.budget if budget is None else budget
+        work, queue, links = self.work, self.queue, self.links
+        popleft, append = queue.popleft, queue.append
+        done = 0
+        while queue:
+            if budget and done == budget:
+                return False
+            i = popleft()
+            done += 1
+            for j in links[i]:
+                if work[j] < 0:
+                    work[j] = i
+                    append(j)
+        self.next = work
+        self.target = self.pending
+        self.work = self.queue = None
+        return True
+
+    def waypoint(self, x, y, tx, ty):
+        # where something at (x, y) should head to reach (tx, ty) through the maze
+        i = self.cell_of(x, y)
+        j = self.next[i]
+        if j < 0 or j == i:
+            return tx, ty
+        return self.center(j)
+
+    def away(self, x, y):
+        # centre of an open neighbour that doesn't lead toward the target (stay put in a dead end)
+        i = self.cell_of(x, y)
+        toward = self.next[i]
+        for j in self.links[i]:
+            if j != toward and self.next[j] == i:
+                return self.center(j)
+        return x, y
+
+
+def step_toward(pos, tx, ty, speed):
+    # move pos (a list) up to speed px toward (tx, ty)
+    dx = tx - pos[0]
+    dy = ty - pos[1]
+    dist = math.hypot(dx, dy)
+    if dist > 0:
+        step = min(speed, dist)
+        pos[0] += step * dx / dist
+        pos[1] += step * dy / dist
+
+
+def benchmark(size=200, cell=79, counts=(1, 100, 1000), frames=300):
+    # per frame cost of moving n chasers along the field, with the player wandering
+    # through the maze into a new cell every 20 frames (4.1 px a frame over 79 px cells)
+    from collision import WallIndex, merge_walls
+    from maze import generate, maze_walls
+    maze = generate(size, size, 1)
+    walls = WallIndex(merge_walls(maze_walls(maze, cell, 7, 25, random.Random(1))), 6, cell)
+    start = time.perf_counter()
+    field = FlowField(maze, cell, walls)
+    links_ms = (time.perf_counter() - start) * 1000
+    passages = sum(map(len, FlowField(maze, cell).links)) // 2
+    rnd = random.Random(2)
+    span = size * cell
+    start = time.perf_counter()
+    field.update(span / 2, span / 2, 0)
+    rebuild_ms = (time.perf_counter() - start) * 1000
+    print(f"{size}x{size} maze: {sum(map(len, field.links)) // 2} links through the walls ({passages} maze "
+          f"passages) found in {links_ms:.0f} ms, one full rebuild {rebuild_ms:.1f} ms")
+    for n in counts:
+        chasers = [[rnd.uniform(0, span), rnd.uniform(0, span)] for _ in range(n)]
+        px, py = field.center(field.target)
+        rebuilds = field.rebuilds
+        field_ms = worst = 0.0
+        start = time.perf_counter()
+        for f in range(frames):
+            if f % 20 == 19:
+                px, py = field.center(rnd.choice(field.links[field.cell_of(px, py)]))
+            t0 = time.perf_counter()
+            field.update(px, py)
+            t1 = time.perf_counter()
+            field_ms += t1 - t0
+            worst = max(worst, t1 - t0)
+            waypoint = field.waypoint
+            for pos in chasers:
+                tx, ty = waypoint(pos[0], pos[1], px, py)
+                step_toward(pos, tx, ty, 3.5)
+        ms = (time.perf_counter() - start) * 1000 / frames
+        chase_ms = ms - field_ms * 1000 / frames
+        print(f"{n:>5} chasers: {ms:7.3f} ms per frame ({chase_ms:.3f} ms moving chasers, "
+              f"{field.rebuilds - rebuilds} rebuilds, worst update {worst * 1000:.2f} ms)")
+
+
+if __name__ == "__main__":
+    benchmark(12)
+    benchmark(200)
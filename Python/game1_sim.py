@@ -0,0 +1,296 @@
+import math
+import random
+import sys
+import time
+
+from collision import WallIndex, merge_walls
+from entities import Movers, Pickups
+from flowfield import FlowField
+from maze import generate as generate_maze, maze_walls
+from spawns import FreeSpace
+
+# constants
+WIDTH, HEIGHT = 1000, 1000  # window size
+CIRCLE_RADIUS = 6  # player radius
+FRAME_DELAY = 16  # ~60 FPS
+STEP = FRAME_DELAY / 1000.0  # one simulation step in seconds, speeds below are per step
+LEADER_SPEED = 4.1  # player speed
+FOLLOWER_SPEED = 3.5  # follower speed
+CELL_SIZE = 79  # maze cell size
+WALL_THICKNESS = 7  # wall thickness
+GAP_SIZE = 25  # gap for small openings
+
+NUM_BLOBS = 4
+BLOB_RADIUS = 6
+
+YELLOW_RADIUS = 12
+NUM_ORBS = 1
+
+NUM_CHASERS = 1  # the first one carries the light
+
+# input vector: one bit per direction
+UP, DOWN, LEFT, RIGHT = 1, 2, 4, 8
+KEY_BITS = {"w": UP, "s": DOWN, "a": LEFT, "d": RIGHT}
+
+
+class Simulation:
+    # Blinding Fear without Tk: maze, walls, entities and the rules, stepped
+    # from an input vector. the same seed and inputs always give the same game
+    def __init__(self, seed=None, width=WIDTH, height=HEIGHT, num_blobs=NUM_BLOBS, num_orbs=NUM_ORBS,
+                 num_chasers=NUM_CHASERS):
+        self.rnd = random.Random(seed)
+        self.width = width
+        self.height = height
+        self.game_time = 0.0
+        self.score = 0
+        self.over = False
+        self.steps = 0
+
+        self.maze = maze = generate_maze(width // CELL_SIZE, height // CELL_SIZE, self.rnd.random())
+        # build wall rects from maze, then fuse the duplicated and touching pieces
+        self.wall_rects = merge_walls(maze_walls(maze, CELL_SIZE, WALL_THICKNESS, GAP_SIZE, self.rnd))
+        # bucket the walls by cell so collision checks only look at nearby ones
+        self.wall_index = WallIndex(self.wall_rects, CIRCLE_RADIUS, CELL_SIZE)
+        # every spot a player sized circle fits, spawns pick from here instead of retrying
+        self.free_space = FreeSpace(width, height, CIRCLE_RADIUS, CIRCLE_RADIUS, self.wall_rects, CIRCLE_RADIUS)
+
+        # set initial positions, every kind of entity keeps its positions in flat arrays
+        self.leader_pos = self.get_safe_spawn()
+        self.chasers = Movers()
+        for _ in range(num_chasers):
+            self.chasers.add(*self.get_safe_spawn())
+        self.blobs = Pickups(BLOB_RADIUS, BLOB_RADIUS * 4)
+        # ids of blobs that respawned since the renderer last looked
+        self.blob_changes = []
+        for _ in range(num_blobs):
+            self.blobs.add(*self.get_safe_blob_spawn())
+        self.orbs = Movers()
+        for _ in range(num_orbs):
+            self.orbs.add(*self.get_safe_yellow_spawn())
+        # the chaser and the orb move along the corridors (and through wall gaps), following this field
+        self.flow = FlowField(maze, CELL_SIZE, self.wall_index)
+        self.flow.update(*self.leader_pos, 0)
+
+    @property
+    def spotlight_pos(self):
+        return self.chasers.position(0)
+
+    @property
+    def yellow_pos(self):
+        return self.orbs.position(0)
+
+    def will_collide(self, x, y):
+        # check collisions with maze walls (only the walls in this point's bucket)
+        return self.wall_index.hit(x, y)
+
+    def get_safe_spawn(self):
+        # find spot not in wall
+        return self.free_space.sample(rnd=self.rnd) or [self.width // 2, self.height // 2]
+
+    def get_safe_blob_spawn(self):
+        # pick blob spot away from walls and player, other blobs are kept off by occupy()
+        lx, ly = self.leader_pos
+        pos = self.free_space.sample(
+            lambda x, y: math.hypot(x - lx, y - ly) > CIRCLE_RADIUS + BLOB_RADIUS + 10, self.rnd
+        )
+        if pos is None:
+            pos = [self.width // 2, self.height // 2]
+        self.free_space.occupy(pos, BLOB_RADIUS * 2)
+        return pos
+
+    def get_safe_yellow_spawn(self):
+        # put yellow near player but not overlapping, on a free spot if there is one
+        lx, ly = self.leader_pos
+        pos = self.free_space.sample(
+            lambda x, y: 80 <= math.hypot(x - lx, y - ly) <= 120, self.rnd, (lx - 120, ly - 120, lx + 120, ly + 120)
+        )
+        if pos is not None:
+            return pos
+        angle = self.rnd.uniform(0, 2 * math.pi)
+        dist = self.rnd.randint(80, 120)
+        x = int(lx + math.cos(angle) * dist)
+        y = int(ly + math.sin(angle) * dist)
+        x = max(YELLOW_RADIUS, min(self.width - YELLOW_RADIUS, x))
+        y = max(YELLOW_RADIUS, min(self.height - YELLOW_RADIUS, y))
+        return [x, y]
+
+    def check_blob_collision(self):
+        # pickup blobs when touching them, only the grid buckets around the player are checked
+        blobs = self.blobs
+        for i in blobs.hits(self.leader_pos[0], self.leader_pos[1], CIRCLE_RADIUS):
+            self.score += 1
+            # respawn this blob
+            self.free_space.release(blobs.position(i), BLOB_RADIUS * 2)
+            blobs.move(i, *self.get_safe_blob_spawn())
+            self.blob_changes.append(i)
+
+    def step(self, inputs, dt=STEP):
+        # one fixed step: move player, follower and yellow orb, pickups, game over
+        if self.over:
+            return
+        self.steps += 1
+        if inputs:
+            # time only counts while a direction is held
+            self.game_time += dt
+        up, down, left, right = inputs & UP, inputs & DOWN, inputs & LEFT, inputs & RIGHT
+        width, height = self.width, self.height
+        will_collide = self.wall_index.hit
+        leader_pos = self.leader_pos
+        new_x, new_y = leader_pos[0], leader_pos[1]
+        leader_speed = LEADER_SPEED
+
+        # pushing into a wall doubles the speed
+        if (
+            (up and will_collide(leader_pos[0], max(leader_pos[1] - LEADER_SPEED, CIRCLE_RADIUS)))
+            or (down and will_collide(leader_pos[0], min(leader_pos[1] + LEADER_SPEED, height - CIRCLE_RADIUS)))
+            or (left and will_collide(max(leader_pos[0] - LEADER_SPEED, CIRCLE_RADIUS), leader_pos[1]))
+            or (right and will_collide(min(leader_pos[0] + LEADER_SPEED, width - CIRCLE_RADIUS), leader_pos[1]))
+        ):
+            leader_speed = int(LEADER_SPEED * 2)
+
+        old_x, old_y = leader_pos[0], leader_pos[1]
+
+        if up:
+            test_y = max(leader_pos[1] - leader_speed, CIRCLE_RADIUS)
+            if not will_collide(leader_pos[0], test_y):
+                new_y = test_y
+        if down:
+            test_y = min(leader_pos[1] + leader_speed, height - CIRCLE_RADIUS)
+            if not will_collide(leader_pos[0], test_y):
+                new_y = test_y
+        if left:
+            test_x = max(leader_pos[0] - leader_speed, CIRCLE_RADIUS)
+            if not will_collide(test_x, new_y):
+                new_x = test_x
+        if right:
+            test_x = min(leader_pos[0] + leader_speed, width - CIRCLE_RADIUS)
+            if not will_collide(test_x, new_y):
+                new_x = test_x
+
+        leader_pos[0], leader_pos[1] = new_x, new_y
+
+        if old_x != new_x or old_y != new_y:
+            flow = self.flow
+            flow.update(new_x, new_y)
+            # chasers head for the next cell on the way to the player, straight at it in the same cell
+            self.chasers.aim(flow.waypoint, FOLLOWER_SPEED, new_x, new_y)
+            self.chasers.integrate()
+
+            # orbs run into a cell further from the player
+            orbs = self.orbs
+            orbs.aim(flow.away, FOLLOWER_SPEED)
+            orbs.integrate()
+            xs, ys = orbs.xs, orbs.ys
+            for i in range(len(xs)):
+                if not (YELLOW_RADIUS < xs[i] < width - YELLOW_RADIUS and YELLOW_RADIUS < ys[i] < height - YELLOW_RADIUS):
+                    orbs.place(i, width // 2, height // 2)
+
+        self.check_blob_collision()
+
+        i = self.orbs.touching(new_x, new_y, CIRCLE_RADIUS + YELLOW_RADIUS)
+        if i >= 0:
+            self.score += 10
+            self.orbs.place(i, *self.get_safe_yellow_spawn())
+
+        if self.chasers.touching(new_x, new_y, CIRCLE_RADIUS * 2) >= 0:
+            self.over = True
+
+    def state(self):
+        # everything a replay has to reproduce, rounded so it compares cleanly
+        return (
+            self.steps,
+            self.score,
+            round(self.game_time, 6),
+            self.over,
+            tuple(round(v, 6) for v in self.leader_pos),
+            tuple(round(v, 6) for v in self.chasers.xs + self.chasers.ys + self.orbs.xs + self.orbs.ys),
+            tuple(self.blobs.xs + self.blobs.ys),
+        )
+
+
+def flee_bot(sim):
+    # input that moves away from the follower, the longer axis first
+    dx = sim.leader_pos[0] - sim.spotlight_pos[0]
+    dy = sim.leader_pos[1] - sim.spotlight_pos[1]
+    bits = (RIGHT if dx >= 0 else LEFT) | (DOWN if dy >= 0 else UP)
+    if sim.rnd.random() < 0.2:
+        bits = 1 << sim.rnd.randrange(4)
+    return bits
+
+
+def random_bot(sim):
+    return sim.rnd.randrange(16)
+
+
+def record(seed, steps, bot=flee_bot):
+    # play a game with a bot, returns the inputs used and the final state
+    sim = Simulation(seed)
+    inputs = []
+    while sim.steps < steps and not sim.over:
+        bits = bot(sim)
+        inputs.append(bits)
+        sim.step(bits)
+    return inputs, sim.state()
+
+
+def replay(seed, inputs):
+    # rerun recorded inputs, a regression changes the returned state
+    sim = Simulation(seed)
+    for bits in inputs:
+        sim.step(bits)
+    return sim.state()
+
+
+def benchmark(sim_seconds=600, bot=random_bot):
+    # how many simulated seconds run per wall clock second, without a display
+    steps = int(sim_seconds / STEP)
+    start = time.perf_counter()
+    sim = Simulation(1)
+    setup = time.perf_counter() - start
+    games = 1
+    start = time.perf_counter()
+    for _ in range(steps):
+        if sim.over:
+            # keep the benchmark about stepping, not about building mazes
+            sim.over = False
+            sim.chasers.place(0, *sim.get_safe_spawn())
+            games += 1
+        sim.step(bot(sim))
+    elapsed = time.perf_counter() - start
+    print(f"setup {setup * 1000:.1f} ms, {steps} steps in {elapsed:.2f} s: "
+          f"{steps / elapsed:.0f} steps/s, {sim_seconds / elapsed:.0f} simulated s per wall s ({games} catches)")
+
+
+def benchmark_crowd(size=4000, blobs=10000, chasers=100, steps=1000):
+    # step cost with a big field full of pickups and a pack of chasers
+    start = time.perf_counter()
+    sim = Simulation(1, size, size, num_blobs=blobs, num_chasers=chasers)
+    setup = time.perf_counter() - start
+    worst = 0.0
+    start = time.perf_counter()
+    for _ in range(steps):
+        if sim.over:
+            sim.over = False
+            for i in range(len(sim.chasers)):
+                sim.chasers.place(i, *sim.get_safe_spawn())
+        t0 = time.perf_counter()
+        sim.step(random_bot(sim))
+        worst = max(worst, time.perf_counter() - t0)
+    ms = (time.perf_counter() - start) * 1000 / steps
+    print(f"{blobs} pickups, {chasers} chasers on {size}x{size}: setup {setup:.1f} s, "
+          f"{ms:.3f} ms per step (worst {worst * 1000:.2f} ms, budget {FRAME_DELAY} ms)")
+
+
+if __name__ == "__main__":
+    # python game1_sim.py         -> step benchmark
+    # python game1_sim.py replay  -> record a bot game and check it replays the same
+    # python game1_sim.py crowd   -> 10,000 pickups and 100 chasers
+    if len(sys.argv) > 1 and sys.argv[1] == "crowd":
+        benchmark_crowd()
+    elif len(sys.argv) > 1 and sys.argv[1] == "replay":
+        for seed in range(5):
+            inputs, final = record(seed, 20000)
+            assert replay(seed, inputs) == final, f"seed {seed} replayed differently"
+            print(f"seed {seed}: {len(inputs)} steps, score {final[1]}, replay matches")
+    else:
+        benchmark()
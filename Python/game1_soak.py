@@ -0,0 +1,79 @@
+import sys
+import tempfile
+import tkinter as tk
+import tracemalloc
+
+import game1
+import score_store
+
+# the leak check for Blinding Fear restarts. a script of its own, so nothing handed
+# to game1.py (the menu passes a player name there) can ever start it
+
+
+def _find_button(frame, text):
+    for widget in frame.winfo_children():
+        if isinstance(widget, tk.Button) and widget.cget("text") == text:
+            return widget
+    raise LookupError(text)
+
+
+def _count_widgets(widget):
+    return 1 + sum(_count_widgets(child) for child in widget.winfo_children())
+
+
+def soak(cycles=1000, frames=3):
+    # START -> a few frames -> GAME OVER -> RETURN TO MENU, over and over.
+    # widgets, canvas items, images, pending after() callbacks and python memory
+    # must stay flat once it has warmed up (needs a display, scores go to a temp dir)
+    game1.PRINT_STATS = False
+    score_store.use_dir(tempfile.mkdtemp(prefix="game1_soak_"))
+    root = tk.Tk()
+    root.geometry(f"{game1.WIDTH}x{game1.HEIGHT}")
+    app = game1.BlindingFear(root, "soak")
+    tracemalloc.start()
+    samples = []
+    first_frames = []
+    items = 0
+    warmup = min(50, cycles // 2)
+    for i in range(cycles):
+        _find_button(root.winfo_children()[-1], "START").invoke()
+        first_frames.append(app.first_frame_ms)
+        for _ in range(frames):
+            if app.sim.over:
+                break
+            app.step(game1.FRAME_DELAY / 1000.0)
+            if not app.sim.over:
+                app.render()
+            root.update()
+        if not app.sim.over:
+            items = len(app.canvas.find_all())
+            app.game_over()
+        _find_button(root.winfo_children()[-1], "RETURN TO MENU").invoke()
+        root.update()
+        if i == warmup or i == cycles - 1:
+            # the next level is being built behind the menu, let it finish so memory is comparable
+            if app.next_level is not None:
+                app.next_level.thread.join()
+            samples.append({
+                "widgets": _count_widgets(root),
+                "items": items,
+                "images": len(root.image_names()),
+                "afters": len(root.tk.splitlist(root.tk.call("after", "info"))),
+                "memory": tracemalloc.get_traced_memory()[0],
+            })
+    tracemalloc.stop()
+    root.destroy()
+    score_store.close()
+    first, last = samples[0], samples[-1]
+    for key in ("widgets", "items", "images", "afters"):
+        print(f"{key:>8}: {first[key]} -> {last[key]}")
+        assert last[key] <= first[key], f"{key} grew over {cycles} restarts"
+    growth = last["memory"] - first["memory"]
+    print(f"  memory: {first['memory'] // 1024} KB -> {last['memory'] // 1024} KB")
+    assert growth < 1024 * 1024, f"memory grew {growth // 1024} KB over {cycles} restarts"
+    print(f"{cycles} restarts, nothing leaked, START to first frame {sum(first_frames) / len(first_frames):.1f} ms on average")
+
+
+if __name__ == "__main__":
+    # python game1_soak.py [cycles]
+    soak(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -5,6 +5,9 @@ import os
 import time
 import sys
 
+import launcher
+import score_store
+
 BASE_DIR = os.path.dirname(__file__)
 NAME_FILE = os.path.join(BASE_DIR, "name.txt")
 USERNAME_FILE = os.path.join(BASE_DIR, "username.txt")
@@ -13,27 +16,36 @@ USERNAME_FILE = os.path.join(BASE_DIR, "username.txt")
 GRID_SIZE = 10
 NUM_MINES = 10
 
-def get_game_settings():
+def get_game_settings(parent=None):
     # ask user for grid size and mines (only called at runtime)
-    root = tk.Tk()
-    root.withdraw()
-    grid_size = simpledialog.askinteger("Grid Size", "Enter grid size (e.g. 10):", minvalue=2, maxvalue=30)
+    # with a parent window the dialogs use it instead of a new Tk root
+    root = None
+    if parent is None:
+        root = tk.Tk()
+        root.withdraw()
+    grid_size = simpledialog.askinteger("Grid Size", "Enter grid size (e.g. 10):", minvalue=2, maxvalue=30, parent=parent)
     if not grid_size:
-        messagebox.showerror("Error", "Grid size is required!")
-        root.destroy()
+        messagebox.showerror("Error", "Grid size is required!", parent=parent)
+        if root:
+            root.destroy()
         raise SystemExit
     max_mines = max(1, grid_size * grid_size - 1)
     num_mines = simpledialog.askinteger("Mines", f"Enter number of mines (max {max_mines}):",
-                                        minvalue=1, maxvalue=max_mines)
+                                        minvalue=1, maxvalue=max_mines, parent=parent)
     if not num_mines:
-        messagebox.showerror("Error", "Number of mines is required!")
-        root.destroy()
+        messagebox.showerror("Error", "Number of mines is required!", parent=parent)
+        if root:
+            root.destroy()
         raise SystemExit
-    root.destroy()
+    if root:
+        root.destroy()
     return grid_size, num_mines
 
 def get_username():
-    # return active name from name.txt or last username entry
+    # use the player handed over by the menu, else fall back to name.txt or the last username entry
+    user = launcher.session_user()
+    if user:
+        return user
     if os.path.exists(NAME_FILE):
         with open(NAME_FILE, "r", encoding="utf-8") as f:
             for line in f:
@@ -61,119 +73,27 @@ def calculate_window_and_button_size(grid_size):
         btn_px = default_btn_px
     return window_size, btn_px
 
-# file helpers for username.txt
-def read_user_lines():
-    # read username file lines, return list
-    if not os.path.exists(USERNAME_FILE):
-        return []
-    with open(USERNAME_FILE, "r", encoding="utf-8") as f:
-        return [ln.rstrip("\n") for ln in f.readlines()]
-
-def write_user_lines(lines):
-    # write normalized lines back to file
-    os.makedirs(BASE_DIR, exist_ok=True)
-    with open(USERNAME_FILE, "w", encoding="utf-8") as f:
-        f.writelines(line if line.endswith("\n") else line + "\n" for line in lines)
-
-def parse_pairs(rest):
-    # parse comma separated k=v pairs into dict
-    pairs = {}
-    for part in rest.split(","):
-        if "=" in part:
-            k, v = part.split("=", 1)
-            pairs[k.strip()] = v.strip()
-    return pairs
-
 def save_game2_score(username, score):
     # update only game2_score for user, keep other keys
-    lines = read_user_lines()
-    found = False
-    out = []
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            continue
-        if stripped.startswith(username + ":"):
-            found = True
-            parts = stripped.split(":", 1)
-            existing = parse_pairs(parts[1]) if len(parts) > 1 else {}
-            try:
-                prev = int(existing.get("game2_score", "0"))
-            except ValueError:
-                prev = 0
-            if score > prev:
-                existing["game2_score"] = str(int(score))
-            else:
-                existing["game2_score"] = str(prev)
-            rest = ",".join(f"{k}={v}" for k, v in existing.items())
-            out.append(f"{username}:{rest}")
-        else:
-            out.append(line)
-    if not found:
-        out.append(f"{username}:game2_score={int(score)}")
-    write_user_lines(out)
+    score_store.save_game2_score(username, score)
 
 def save_game2_time(username, elapsed_time, grid_size, num_mines):
     # update best time, grid, mines for game2 (lower time is better)
-    lines = read_user_lines()
-    found = False
-    out = []
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            continue
-        if stripped.startswith(username + ":"):
-            found = True
-            parts = stripped.split(":", 1)
-            existing = parse_pairs(parts[1]) if len(parts) > 1 else {}
-            prev_time = None
-            try:
-                if "game2_time" in existing:
-                    prev_time = int(existing["game2_time"])
-            except ValueError:
-                prev_time = None
-            if prev_time is None or int(elapsed_time) < prev_time:
-                existing["game2_time"] = str(int(elapsed_time))
-                existing["game2_grid"] = str(int(grid_size))
-                existing["game2_mines"] = str(int(num_mines))
-            else:
-                # keep old time, but make sure grid/mines exist
-                existing.setdefault("game2_grid", str(int(grid_size)))
-                existing.setdefault("game2_mines", str(int(num_mines)))
-                existing["game2_time"] = str(int(prev_time)) if prev_time is not None else str(int(elapsed_time))
-            rest = ",".join(f"{k}={v}" for k, v in existing.items())
-            out.append(f"{username}:{rest}")
-        else:
-            out.append(line)
-    if not found:
-        out.append(f"{username}:game2_time={int(elapsed_time)},game2_grid={int(grid_size)},game2_mines={int(num_mines)}")
-    write_user_lines(out)
+    score_store.save_game2_time(username, elapsed_time, grid_size, num_mines)
 
 def get_game2_score(username):
     # read saved game2_score for username, return 0 if not found
-    if os.path.exists(USERNAME_FILE):
-        with open(USERNAME_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                stripped = line.strip()
-                if stripped.startswith(username + ":"):
-                    parts = stripped.split(":", 1)
-                    if len(parts) > 1:
-                        for g in parts[1].split(","):
-                            if g.startswith("game2_score="):
-                                try:
-                                    return int(g.split("=", 1)[1])
-                                except ValueError:
-                                    return 0
-    return 0
+    return score_store.get_user(username).get("game2_score", 0)
 
 class MineSweeper:
-    def __init__(self, master, username):
-        # setup UI and state
+    def __init__(self, master, username, on_exit=None):
+        # setup UI and state, master can be a Tk root or a frame in the main menu
         self.master = master
         self.username = username
+        self.on_exit = on_exit
         self.score = get_game2_score(username)
         self.window_size, self.btn_px = calculate_window_and_button_size(GRID_SIZE)
-        self.master.geometry(f"{self.window_size}x{self.window_size+150}")
+        self.master.winfo_toplevel().geometry(f"{self.window_size}x{self.window_size+150}")
         self.timer_label = tk.Label(self.master, text="Time: 0s", font=("Arial", 12))
         self.timer_label.pack(pady=5)
         self.start_time = None
@@ -210,12 +130,20 @@ class MineSweeper:
         btn_frame = tk.Frame(self.master)
         btn_frame.pack(pady=10)
         tk.Button(btn_frame, text="Restart", command=self.reset_game).pack(side="left", padx=10)
-        tk.Button(btn_frame, text="Exit", command=self.master.destroy).pack(side="left", padx=10)
+        tk.Button(btn_frame, text="Exit", command=self.exit).pack(side="left", padx=10)
 
         self.start_time = time.time()
         self.timer_running = True
         self.update_timer()
 
+    def exit(self):
+        # stop the timer and leave (back to host menu or close window)
+        self.timer_running = False
+        if self.on_exit:
+            self.on_exit()
+        else:
+            self.master.destroy()
+
     def update_timer(self):
         # update elapsed time label
         if self.timer_running:
@@ -270,13 +198,17 @@ class MineSweeper:
         else:
             messagebox.showinfo("Mine Sweeper", "You hit a mine! Game over.")
 
-if __name__ == "__main__":
+def main(username=None):
     # get settings at runtime to avoid dialogs on import
+    global GRID_SIZE, NUM_MINES
+    asked = time.time()
     try:
         GRID_SIZE, NUM_MINES = get_game_settings()
     except SystemExit:
         # user cancelled, exit cleanly
         sys.exit(0)
+    # the launch clock started at the menu click, typing into the dialogs isn't launch time
+    launcher.exclude_launch_time(time.time() - asked)
 
     root = tk.Tk()
     root.title("Minesweeper")
@@ -284,6 +216,10 @@ if __name__ == "__main__":
     win_w = min(800, GRID_SIZE * 40)
     win_h = min(800, GRID_SIZE * 40 + 150)
     root.geometry(f"{win_w}x{win_h}")
-    username = get_username()
+    username = username or get_username()
     app = MineSweeper(root, username)
+    launcher.report_first_frame(root, "game2")
     root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,9 @@ from tkinter import messagebox
 import random
 import time
 import os
-import sys
+
+import launcher
+import score_store
 
 BASE_DIR = os.path.dirname(__file__)
 USERNAME_FILE = os.path.join(BASE_DIR, "username.txt")
@@ -23,14 +25,11 @@ def read_user_lines():
     with open(USERNAME_FILE, "r", encoding="utf-8") as f:
         return [line.rstrip("\n") for line in f if line.strip()]
 
-def write_user_lines(lines):
-    # write lines back, make sure file and newline are ok
-    os.makedirs(BASE_DIR, exist_ok=True)
-    with open(USERNAME_FILE, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + ("\n" if lines else ""))
-
 def get_username():
-    # try name.txt first, return first non-empty line, else try last username entry
+    # use the player handed over by the menu, else fall back to name.txt or the last username entry
+    user = launcher.session_user()
+    if user:
+        return user
     if os.path.exists(NAME_FILE):
         with open(NAME_FILE, "r", encoding="utf-8") as nf:
             for line in nf:
@@ -48,52 +47,12 @@ def get_username():
     return None
 
 def ensure_user_exists(name):
-    # add "name:" line if it's missing
-    if not name:
-        return
-    lines = read_user_lines()
-    for line in lines:
-        if ":" in line and line.split(":", 1)[0].strip() == name:
-            return
-    lines.append(f"{name}:")
-    write_user_lines(lines)
+    # add user to the score store if it's missing
+    score_store.ensure_user(name)
 
 def update_game3_score(name, score, time_seconds):
     # update only game3 and game3_time for the user
-    lines = read_user_lines()
-    found = False
-    out = []
-    for line in lines:
-        line_strip = line.strip()
-        if not line_strip:
-            continue
-        if line_strip.startswith(name + ":"):
-            found = True
-            parts = line_strip.split(":", 1)
-            existing = {}
-            if len(parts) > 1 and parts[1].strip():
-                for part in parts[1].split(","):
-                    if "=" in part:
-                        k, v = part.split("=", 1)
-                        existing[k.strip()] = v.strip()
-            try:
-                prev_score = int(existing.get("game3", "0"))
-            except Exception:
-                prev_score = 0
-            if score > prev_score:
-                existing["game3"] = str(int(score))
-                existing["game3_time"] = str(int(time_seconds))
-            else:
-                # keep old score if it's better, ensure keys exist
-                existing.setdefault("game3", str(prev_score))
-                existing.setdefault("game3_time", str(int(time_seconds)))
-            rest = ",".join(f"{k}={v}" for k, v in existing.items())
-            out.append(f"{name}:{rest}")
-        else:
-            out.append(line_strip)
-    if not found:
-        out.append(f"{name}:game3={int(score)},game3_time={int(time_seconds)}")
-    write_user_lines(out)
+    score_store.save_game3(name, score, time_seconds)
 
 def get_last_username():
     # return username from last line of file
@@ -106,10 +65,13 @@ def get_last_username():
     return last.strip()
 
 class SnakeGame:
-    def __init__(self, master, initial_username=""):
+    def __init__(self, master, initial_username="", on_exit=None):
+        # master can be a Tk root or a frame in the main menu
         self.master = master
-        master.title("Snake")
-        master.resizable(False, False)
+        self.on_exit = on_exit
+        top = master.winfo_toplevel()
+        top.title("Snake")
+        top.resizable(False, False)
 
         self.menu_frame = tk.Frame(master)
         self.menu_frame.pack(fill="both", expand=True)
@@ -124,7 +86,7 @@ class SnakeGame:
         btn_frame = tk.Frame(self.menu_frame)
         btn_frame.pack(pady=30)
         tk.Button(btn_frame, text="Start Game", width=16, height=2, command=self.start_game).grid(row=0, column=0, padx=10, pady=5)
-        tk.Button(btn_frame, text="Exit", width=16, height=2, command=self.master.quit).grid(row=0, column=1, padx=10, pady=5)
+        tk.Button(btn_frame, text="Exit", width=16, height=2, command=self.quit).grid(row=0, column=1, padx=10, pady=5)
 
         # game UI (hidden until start)
         self.game_frame = tk.Frame(master)
@@ -135,17 +97,28 @@ class SnakeGame:
         bottom_frame = tk.Frame(self.game_frame)
         bottom_frame.pack(fill="x", pady=6)
         tk.Button(bottom_frame, text="Exit to Menu", command=self.exit_to_menu).pack(side="left", padx=10)
-        tk.Button(bottom_frame, text="Quit", command=self.master.quit).pack(side="right", padx=10)
+        tk.Button(bottom_frame, text="Quit", command=self.quit).pack(side="right", padx=10)
 
         # game state
         self.running = False
         self.reset_game_state()
 
         # controls
-        master.bind("<Up>", lambda e: self.change_dir("Up"))
-        master.bind("<Down>", lambda e: self.change_dir("Down"))
-        master.bind("<Left>", lambda e: self.change_dir("Left"))
-        master.bind("<Right>", lambda e: self.change_dir("Right"))
+        top.bind("<Up>", lambda e: self.change_dir("Up"))
+        top.bind("<Down>", lambda e: self.change_dir("Down"))
+        top.bind("<Left>", lambda e: self.change_dir("Left"))
+        top.bind("<Right>", lambda e: self.change_dir("Right"))
+
+    def quit(self):
+        # stop and leave (back to host menu or end mainloop)
+        self.running = False
+        top = self.master.winfo_toplevel()
+        for key in ("<Up>", "<Down>", "<Left>", "<Right>"):
+            top.unbind(key)
+        if self.on_exit:
+            self.on_exit()
+        else:
+            self.master.quit()
 
     def reset_game_state(self):
         # reset snake, direction, food, score
@@ -245,10 +218,12 @@ class SnakeGame:
         self.game_frame.pack_forget()
         self.menu_frame.pack(fill="both", expand=True)
 
-if __name__ == "__main__":
+def main(username=""):
     root = tk.Tk()
-    initial_user = sys.argv[1] if len(sys.argv) > 1 else ""
-    app = SnakeGame(root, initial_username=initial_user)
-    root.mainloop()
+    initial_user = username or launcher.session_user() or ""
     app = SnakeGame(root, initial_username=initial_user)
+    launcher.report_first_frame(root, "game3")
     root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import statistics
+import time
+from collections import deque
+
+
+class FixedLoop:
+    # one after() chain for a game: measures real time, runs update(step) at a fixed
+    # step as often as the time passed needs, then renders once per tick.
+    # if the machine falls behind it skips renders, not game time, and past
+    # max_steps per tick the rest is dropped so it can't spiral
+    def __init__(self, master, step, update, render, max_steps=5):
+        self.master = master
+        self.step = step
+        self.update = update
+        self.render = render
+        self.max_steps = max_steps
+        self.running = False
+        self.handle = None
+        self.acc = 0.0
+        self.last = 0.0
+        # perf_counter time the step being run ends at, for timestamped input
+        self.step_end = 0.0
+        self.started = 0.0
+        self.frames = 0
+        self.steps = 0
+        self.dropped = 0
+        self.intervals = deque(maxlen=600)
+
+    def start(self):
+        self.running = True
+        self.acc = 0.0
+        self.started = self.last = self.step_end = time.perf_counter()
+        self.handle = self.master.after(int(self.step * 1000), self.tick)
+
+    def stop(self):
+        self.running = False
+        if self.handle is not None:
+            try:
+                self.master.after_cancel(self.handle)
+            except Exception:
+                pass
+            self.handle = None
+
+    def tick(self):
+        self.handle = None
+        if not self.running:
+            return
+        now = time.perf_counter()
+        self.intervals.append(now - self.last)
+        self.acc += now - self.last
+        self.last = now
+        done = 0
+        while self.acc >= self.step:
+            if done == self.max_steps:
+                # too far behind, let the missed steps go
+                self.dropped += int(self.acc // self.step)
+                self.acc %= self.step
+                break
+            # steps catch up on the time since the last tick, oldest first
+            self.step_end = now - self.acc + self.step
+            self.update(self.step)
+            self.acc -= self.step
+            self.steps += 1
+            done += 1
+            if not self.running:
+                return
+        self.render()
+        self.frames += 1
+        # wake up around the next step boundary
+        delay = max(1, int((self.step - self.acc) * 1000))
+        self.handle = self.master.after(delay, self.tick)
+
+    def stats_text(self):
+        elapsed = time.perf_counter() - self.started
+        fps = self.frames / elapsed if elapsed > 0 else 0
+        if len(self.intervals) > 1:
+            mean = statistics.fmean(self.intervals) * 1000
+            jitter = statistics.pstdev(self.intervals) * 1000
+        else:
+            mean = jitter = 0.0
+        return (
+            f"{fps:.1f} fps, tick {mean:.1f} ms +/- {jitter:.1f} ms, "
+            f"{self.steps} steps, {self.dropped} dropped"
+        )
@@ -0,0 +1,136 @@
+import random
+import time
+from collections import deque
+
+
+class LatencyHistogram:
+    # counts of latencies in bucket_ms wide buckets, the last bucket takes everything above
+    def __init__(self, bucket_ms=1, buckets=250):
+        self.bucket_ms = bucket_ms
+        self.counts = [0] * buckets
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds):
+        ms = seconds * 1000
+        self.counts[min(int(ms // self.bucket_ms), len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total += ms
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p):
+        # upper edge of the bucket holding the p-th percentile, in ms
+        if not self.count:
+            return 0.0
+        need = self.count * p / 100
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= need:
+                return (i + 1) * self.bucket_ms
+        return len(self.counts) * self.bucket_ms
+
+    def stats_text(self):
+        return (f"{self.count} inputs, mean {self.mean():.1f} ms, p50 {self.percentile(50)} ms, "
+                f"p95 {self.percentile(95)} ms, p99 {self.percentile(99)} ms")
+
+    def export(self, path, label=""):
+        # one "label,from_ms,to_ms,count" line per non-empty bucket, appended so runs
+        # with different settings (FRAME_DELAY, machines) can go in one file
+        with open(path, "a", encoding="utf-8") as f:
+            last = len(self.counts) - 1
+            for i, n in enumerate(self.counts):
+                if n:
+                    to = "" if i == last else (i + 1) * self.bucket_ms
+                    f.write(f"{label},{i * self.bucket_ms},{to},{n}\n")
+
+
+class InputQueue:
+    # key events stamped with perf_counter when Tk delivers them. each fixed step
+    # takes the events up to the time it stands for, so input lands in the step it
+    # happened in, and a tap shorter than a tick still moves the player for a step.
+    # rendered() then records how long every applied key took to reach the screen
+    def __init__(self, key_bits, latency=None):
+        self.key_bits = key_bits
+        self.events = deque()
+        self.held = 0
+        self.waiting = []
+        self.latency = latency if latency is not None else LatencyHistogram()
+
+    def press(self, key, t=None):
+        bit = self.key_bits.get(key)
+        if bit:
+            self.events.append((time.perf_counter() if t is None else t, bit, True))
+
+    def release(self, key, t=None):
+        bit = self.key_bits.get(key)
+        if bit:
+            self.events.append((time.perf_counter() if t is None else t, bit, False))
+
+    def inputs_at(self, t):
+        # input bits for a step ending at time t: what is held then, plus anything
+        # pressed during the step even if it was let go again before t
+        events = self.events
+        before = self.held
+        held = before
+        tapped = 0
+        while events and events[0][0] <= t:
+            stamp, bit, down = events.popleft()
+            if down:
+                if not held & bit:
+                    held |= bit
+                    tapped |= bit
+                    # key repeat sends release+press pairs, only a real new press is timed
+                    if not before & bit:
+                        self.waiting.append(stamp)
+            else:
+                held &= ~bit
+        self.held = held
+        return held | tapped
+
+    def rendered(self, t=None):
+        # a frame showing every applied input went out
+        if self.waiting:
+            t = time.perf_counter() if t is None else t
+            for stamp in self.waiting:
+                self.latency.add(t - stamp)
+            self.waiting.clear()
+
+    def clear(self):
+        self.events.clear()
+        self.held = 0
+        self.waiting.clear()
+
+
+def benchmark(step_ms=16, taps=10000, tap_ms=(5, 10, 20)):
+    # short taps landing at random points between ticks (one tick = one step):
+    # how many reach the game when the held keys are sampled per tick vs queued
+    rnd = random.Random(1)
+    step = step_ms / 1000
+    for length in tap_ms:
+        sampled = queued = 0
+        latency = LatencyHistogram()
+        for _ in range(taps):
+            down = rnd.uniform(0, step)
+            up = down + length / 1000
+            # sampling sees the key only if a tick falls while it is down
+            if int(up // step) > int(down // step):
+                sampled += 1
+            queue = InputQueue({"w": 1}, latency)
+            queue.press("w", down)
+            queue.release("w", up)
+            tick = step
+            seen = 0
+            while tick < up + step:
+                seen |= queue.inputs_at(tick)
+                queue.rendered(tick)
+                tick += step
+            queued += seen & 1
+        print(f"{length:>3} ms taps, {step_ms} ms ticks: {sampled * 100 / taps:5.1f}% seen sampled, "
+              f"{queued * 100 / taps:5.1f}% seen queued, key to frame {latency.stats_text()}")
+
+
+if __name__ == "__main__":
+    benchmark()
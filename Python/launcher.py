@@ -0,0 +1,177 @@
+import os
+import subprocess
+import sys
+import time
+
+import score_store
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LAUNCH_LOG = os.path.join(BASE_DIR, "launch_times.txt")
+# print and log click-to-first-frame times (REPORT_LAUNCH_TIMES=1 in the environment, games inherit it)
+REPORT_LAUNCH_TIMES = os.environ.get("REPORT_LAUNCH_TIMES") == "1"
+
+GAMES = {
+    "game1": os.path.join(BASE_DIR, "game1.py"),
+    "game2": os.path.join(BASE_DIR, "game2.py"),
+    "game3": os.path.join(BASE_DIR, "game3.py"),
+}
+
+# warm mode keeps one worker process with tkinter and the games already imported,
+# each launch forks it instead of starting a new python (needs os.fork, so not on windows)
+WARM_LAUNCH = hasattr(os, "fork")
+
+_worker = None
+
+
+def start_worker():
+    # start the pre-warmed worker, returns False if warm mode is not available
+    # (it reads launches from our stdin pipe and exits when the menu closes it by exiting)
+    global _worker
+    if not WARM_LAUNCH:
+        return False
+    if _worker is not None and _worker.poll() is None:
+        return True
+    try:
+        _worker = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--worker"],
+            stdin=subprocess.PIPE,
+            text=True,
+        )
+    except OSError:
+        _worker = None
+        return False
+    return True
+
+
+def session_user():
+    # player handed over by the menu: argv[1] first, then GAME_USER, else None
+    if len(sys.argv) > 1 and sys.argv[1]:
+        return sys.argv[1]
+    return os.environ.get("GAME_USER") or None
+
+
+def session_id():
+    # menu login session: argv[2] first, then GAME_SESSION, else None
+    if len(sys.argv) > 2 and sys.argv[2]:
+        return sys.argv[2]
+    return os.environ.get("GAME_SESSION") or None
+
+
+def launch(game, username="", session=""):
+    # start a game, through the warm worker if it's running, else a fresh python
+    # the player and session go as "gameN.py <user> <session>" plus GAME_USER/GAME_SESSION
+    click_time = time.time()
+    if _worker is not None and _worker.poll() is None:
+        try:
+            _worker.stdin.write(f"{game}\t{username}\t{session}\t{click_time}\n")
+            _worker.stdin.flush()
+            return "warm"
+        except OSError:
+            pass
+    env = dict(os.environ, LAUNCH_CLICK_TIME=str(click_time), LAUNCH_MODE="cold", GAME_USER=username, GAME_SESSION=session)
+    args = [GAMES[game], username, session]
+    try:
+        subprocess.Popen([sys.executable] + args, env=env)
+    except Exception:
+        # fallback to plain call
+        subprocess.Popen(["python"] + args, env=env)
+    return "cold"
+
+
+def exclude_launch_time(seconds):
+    # leave time spent waiting on the player (setup dialogs) out of the launch time
+    click_time = os.environ.get("LAUNCH_CLICK_TIME")
+    if click_time:
+        os.environ["LAUNCH_CLICK_TIME"] = str(float(click_time) + seconds)
+
+
+def report_first_frame(root, game):
+    # once the first frame is drawn, log how long it took since the menu click,
+    # tagged with the menu login session so one sitting's launches can be picked out
+    click_time = os.environ.get("LAUNCH_CLICK_TIME")
+    if not click_time or not REPORT_LAUNCH_TIMES:
+        return
+    mode = os.environ.get("LAUNCH_MODE", "cold")
+    session = session_id() or ""
+
+    def log():
+        ms = (time.time() - float(click_time)) * 1000
+        print(f"{game} {mode} launch: {ms:.1f} ms to first frame (session {session or '-'})")
+        try:
+            with open(LAUNCH_LOG, "a", encoding="utf-8") as f:
+                f.write(f"{game},{mode},{ms:.1f},{session}\n")
+        except OSError:
+            pass
+        os.environ.pop("LAUNCH_CLICK_TIME", None)
+
+    root.after_idle(lambda: root.after(0, log))
+
+
+def run_worker():
+    # worker loop: load everything once, then fork a child per launch request
+    import signal
+    import traceback
+    # import tkinter and the games once here so every forked game skips it
+    import game1
+    import game2
+    import game3
+    modules = {"game1": game1, "game2": game2, "game3": game3}
+
+    # let finished games be cleaned up automatically
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    for line in sys.stdin:
+        parts = line.rstrip("\n").split("\t")
+        if len(parts) != 4 or parts[0] not in modules:
+            continue
+        game, username, session, click_time = parts
+        if os.fork() == 0:
+            # child: become the game
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            os.environ["LAUNCH_CLICK_TIME"] = click_time
+            os.environ["LAUNCH_MODE"] = "warm"
+            os.environ["GAME_USER"] = username
+            os.environ["GAME_SESSION"] = session
+            sys.argv = [GAMES[game], username, session]
+            sys.stdin = open(os.devnull, "r")
+            try:
+                modules[game].main(username)
+            except SystemExit:
+                pass
+            except Exception:
+                traceback.print_exc()
+            finally:
+                # os._exit skips atexit, so let a score compaction finish first
+                score_store.close()
+                sys.stdout.flush()
+                os._exit(0)
+
+
+def print_stats(session=None):
+    # average click-to-first-frame per game and launch mode from the log,
+    # only the launches of one menu session if given (older lines have none)
+    totals = {}
+    if os.path.exists(LAUNCH_LOG):
+        with open(LAUNCH_LOG, "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.strip().split(",")
+                if len(parts) == 3:
+                    parts.append("")
+                if len(parts) == 4 and (session is None or parts[3] == session):
+                    key = (parts[0], parts[1])
+                    count, total = totals.get(key, (0, 0.0))
+                    totals[key] = (count + 1, total + float(parts[2]))
+    if not totals:
+        print("no launches logged yet (start the menu with REPORT_LAUNCH_TIMES=1)")
+    for (game, mode), (count, total) in sorted(totals.items()):
+        print(f"{game} {mode:>4}: {total / count:8.1f} ms average over {count} launches")
+
+
+if __name__ == "__main__":
+    # python launcher.py --worker        -> run the warm worker (started by 1menu.py)
+    # python launcher.py stats           -> show measured launch times
+    # python launcher.py stats <session> -> the same for one menu session
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        run_worker()
+    elif len(sys.argv) > 1 and sys.argv[1] == "stats":
+        print_stats(sys.argv[2] if len(sys.argv) > 2 else None)
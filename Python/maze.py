@@ -0,0 +1,176 @@
+import itertools
+import random
+import time
+
+# wall bits of a cell, a fresh cell has all four
+TOP, RIGHT, BOTTOM, LEFT = 1, 2, 4, 8
+ALL_WALLS = TOP | RIGHT | BOTTOM | LEFT
+_START = 5  # entry code of the cell the search starts from, it wasn't entered from anywhere
+
+
+class Maze:
+    # perfect maze in one bytearray, one byte of wall bits per cell
+    # the grid has a ring of border cells around it, so cell (x, y) is at (y + 1) * (cols + 2) + x + 1
+    def __init__(self, cols, rows, cells):
+        self.cols = cols
+        self.rows = rows
+        self.cells = cells
+
+    def walls(self, x, y):
+        return self.cells[(y + 1) * (self.cols + 2) + x + 1]
+
+    def has_wall(self, x, y, side):
+        return bool(self.walls(x, y) & side)
+
+    def is_perfect(self):
+        # every cell reachable, walls agree on both sides and no loops (cols * rows - 1 passages)
+        cols, rows = self.cols, self.rows
+        stride = cols + 2
+        cells = self.cells
+        seen = bytearray(len(cells))
+        start = stride + 1
+        seen[start] = 1
+        todo = [start]
+        reached = 1
+        passages = 0
+        pairs = ((-stride, TOP, BOTTOM), (1, RIGHT, LEFT), (stride, BOTTOM, TOP), (-1, LEFT, RIGHT))
+        while todo:
+            i = todo.pop()
+            for step, here, there in pairs:
+                j = i + step
+                if not cells[i] & here:
+                    if cells[j] & there or not 0 <= (j % stride) - 1 < cols or not 0 <= j // stride - 1 < rows:
+                        return False
+                    passages += 1
+                    if not seen[j]:
+                        seen[j] = 1
+                        reached += 1
+                        todo.append(j)
+        return reached == cols * rows and passages == 2 * (cols * rows - 1)
+
+
+def _blank(cols, rows):
+    # all walls up inside, 0 on the border ring
+    stride = cols + 2
+    cells = bytearray(stride * (rows + 2))
+    row = bytes([ALL_WALLS]) * cols
+    for y in range(1, rows + 1):
+        cells[y * stride + 1:y * stride + 1 + cols] = row
+    return cells
+
+
+def _carve(cols, rows, rnd):
+    # depth first search with an explicit stack. the loop only notes which way each
+    # cell was entered (that doubles as its visited mark) and a cell rescans its
+    # shuffled directions when the search backs up to it, the ones it already tried
+    # are all visited by then. the walls come out of the entry directions afterwards
+    stride = cols + 2
+    size = stride * (rows + 2)
+    came = bytearray(b"\xff") * size  # the border ring reads as visited
+    inner = bytes(cols)
+    for y in range(1, rows + 1):
+        came[y * stride + 1:y * stride + 1 + cols] = inner
+    # direction codes 1-4 for up, right, down, left, _START for the first cell.
+    # each cell gets one of the 24 orders as a flat (step, code) * 4 tuple
+    dirs = ((-stride, 1), (1, 2), (stride, 3), (-1, 4))
+    orders = [sum(order, ()) for order in itertools.permutations(dirs)]
+    picks = [orders[b % len(orders)] for b in rnd.randbytes(size)]
+    start = (rnd.randrange(rows) + 1) * stride + rnd.randrange(cols) + 1
+    came[start] = _START
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    i = start
+    while True:
+        # the four checks written out, this loop runs twice per cell
+        s0, d0, s1, d1, s2, d2, s3, d3 = picks[i]
+        if not came[i + s0]:
+            j = i + s0
+            came[j] = d0
+        elif not came[i + s1]:
+            j = i + s1
+            came[j] = d1
+        elif not came[i + s2]:
+            j = i + s2
+            came[j] = d2
+        elif not came[i + s3]:
+            j = i + s3
+            came[j] = d3
+        elif stack:
+            i = pop()
+            continue
+        else:
+            break
+        push(i)
+        i = j
+    return _walls_from(bytes(came), cols, rows)
+
+
+def _walls_from(came, cols, rows):
+    # a cell loses the side it was entered through, and its parent (one step back)
+    # the side it was left through. both are byte translations of came, the parent's
+    # is shifted by the step, all combined as big ints instead of a loop over the cells
+    stride = cols + 2
+    size = len(came)
+    removed = int.from_bytes(came.translate(bytes([0, BOTTOM, LEFT, TOP, RIGHT]) + bytes(251)), "little")
+    for d, step, side in ((1, -stride, TOP), (2, 1, RIGHT), (3, stride, BOTTOM), (4, -1, LEFT)):
+        table = bytearray(256)
+        table[d] = side
+        exits = int.from_bytes(came.translate(table), "little")
+        # byte k of the int is cell k, the parent of cell j is j - step
+        removed |= exits >> (8 * step) if step > 0 else exits << (-8 * step)
+    walls = int.from_bytes(_blank(cols, rows), "little") ^ removed
+    return bytearray((walls & ((1 << (8 * size)) - 1)).to_bytes(size, "little"))
+
+
+def generate(cols, rows, seed=None):
+    # same seed and size give the same maze, one depth first search over the whole grid
+    return Maze(cols, rows, _carve(cols, rows, random.Random(seed)))
+
+
+def maze_walls(maze, cell, thickness, gap, rnd=random):
+    # wall rectangles for every cell side that still has a wall, each full side
+    # gets a gap somewhere along it (neighbouring cells draw the shared side twice)
+    rects = []
+    for row in range(maze.rows):
+        for col in range(maze.cols):
+            x1 = col * cell
+            y1 = row * cell
+            x2 = x1 + cell
+            y2 = y1 + cell
+            walls = maze.walls(col, row)
+
+            if walls & TOP:
+                mid_x1 = x1 + (cell - gap) // rnd.randint(1, 9)
+                rects.append((x1, y1, mid_x1, y1 + thickness))
+                rects.append((mid_x1 + gap, y1, x2, y1 + thickness))
+
+            if walls & RIGHT:
+                mid_y1 = y1 + (cell - gap) // rnd.randint(1, 9)
+                rects.append((x2 - thickness, y1, x2, mid_y1))
+                rects.append((x2 - thickness, mid_y1 + gap, x2, y2))
+
+            if walls & BOTTOM:
+                mid_x1 = x1 + (cell - gap) // rnd.randint(1, 9)
+                rects.append((x1, y2 - thickness, mid_x1, y2))
+                rects.append((mid_x1 + gap, y2 - thickness, x2, y2))
+
+            if walls & LEFT:
+                mid_y1 = y1 + (cell - gap) // rnd.randint(1, 9)
+                rects.append((x1, y1, x1 + thickness, mid_y1))
+                rects.append((x1, mid_y1 + gap, x1 + thickness, y2))
+    return rects
+
+
+def benchmark(sizes=((12, 12), (200, 200), (1000, 1000)), runs=3):
+    for cols, rows in sizes:
+        start = time.perf_counter()
+        for seed in range(runs):
+            maze = generate(cols, rows, seed)
+        ms = (time.perf_counter() - start) * 1000 / runs
+        assert maze.is_perfect()
+        print(f"{cols}x{rows}: {ms:8.1f} ms per maze")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,51 @@
+import threading
+import time
+
+
+class Prebuild:
+    # runs build() on a worker thread so it is ready by the time it is needed.
+    # build must not touch Tk (Tk only likes its own thread), plain python objects only
+    def __init__(self, build):
+        self.build = build
+        self.result = None
+        self.error = None
+        self.build_ms = 0.0
+        self.wait_ms = 0.0
+        self.thread = threading.Thread(target=self._run, name="prebuild", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            self.result = self.build()
+        except BaseException as e:
+            self.error = e
+        self.build_ms = (time.perf_counter() - start) * 1000
+
+    def take(self):
+        # the finished result, waiting for the worker if it isn't done yet
+        start = time.perf_counter()
+        self.thread.join()
+        self.wait_ms = (time.perf_counter() - start) * 1000
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def benchmark(sizes=(1000, 4000), menu_s=2.0):
+    # what START waits for a level: building it right there vs taking one
+    # that was built while the menu was up for menu_s seconds
+    from game1_sim import Simulation
+    for size in sizes:
+        start = time.perf_counter()
+        Simulation(1, size, size)
+        sync_ms = (time.perf_counter() - start) * 1000
+        pending = Prebuild(lambda: Simulation(1, size, size))
+        time.sleep(menu_s)
+        pending.take()
+        print(f"level {size}px: {sync_ms:.1f} ms built at START, {pending.wait_ms:.2f} ms prebuilt "
+              f"(built in {pending.build_ms:.1f} ms behind the menu)")
+
+
+if __name__ == "__main__":
+    benchmark()
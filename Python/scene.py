@@ -0,0 +1,61 @@
+class Scene:
+    # canvas items that live as long as their entity, frames only move them
+    # counts every call that goes to Tk so the savings can be checked
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.items = {}
+        self.tk_calls = 0
+        self.frames = 0
+
+    def oval(self, x, y, r, fill, tags=""):
+        # one circle item, returns the item id
+        self.tk_calls += 1
+        item = self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=fill, outline="", tags=tags)
+        self.items[item] = (x - r, y - r, x + r, y + r)
+        return item
+
+    def rect(self, x1, y1, x2, y2, fill, tags=""):
+        self.tk_calls += 1
+        item = self.canvas.create_rectangle(x1, y1, x2, y2, fill=fill, outline="", tags=tags)
+        self.items[item] = (x1, y1, x2, y2)
+        return item
+
+    def image(self, x, y, image):
+        self.tk_calls += 1
+        item = self.canvas.create_image((x, y), image=image, anchor="nw")
+        self.items[item] = (x, y)
+        return item
+
+    def move_oval(self, item, x, y, r):
+        # only talks to Tk if the circle actually moved
+        self.move(item, (x - r, y - r, x + r, y + r))
+
+    def move(self, item, coords):
+        # new coords for any item, skipped if nothing changed
+        if self.items.get(item) == coords:
+            return
+        self.items[item] = coords
+        self.tk_calls += 1
+        self.canvas.coords(item, *coords)
+
+    def lower(self, item, below):
+        # put item just under the item(s) tagged below in the stacking order
+        self.tk_calls += 1
+        self.canvas.tag_lower(item, below)
+
+    def show(self, item, visible):
+        self.tk_calls += 1
+        self.canvas.itemconfig(item, state="normal" if visible else "hidden")
+
+    def view(self, x, y, width, height):
+        # scroll the canvas so (x, y) is its top left corner (the scrollregion is the whole level)
+        self.tk_calls += 2
+        self.canvas.xview_moveto(x / width)
+        self.canvas.yview_moveto(y / height)
+
+    def end_frame(self):
+        self.frames += 1
+
+    def stats_text(self):
+        per_frame = self.tk_calls / self.frames if self.frames else 0
+        return f"{len(self.items)} canvas items, {self.tk_calls} Tk calls over {self.frames} frames ({per_frame:.1f} per frame)"
@@ -0,0 +1,626 @@
+import atexit
+import bisect
+import sqlite3
+import os
+import sys
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_FILE = os.path.join(BASE_DIR, "scores.db")
+USERNAME_FILE = os.path.join(BASE_DIR, "username.txt")
+JOURNAL_FILE = os.path.join(BASE_DIR, "scores_journal.txt")
+COMPACTING_FILE = JOURNAL_FILE + ".compacting"
+COMPACT_LOCK = JOURNAL_FILE + ".lock"
+
+# columns kept for every user, same keys as the old username.txt pairs
+FIELDS = ["game1", "game1_time", "game2_score", "game2_time", "game2_grid", "game2_mines", "game3", "game3_time"]
+
+# leaderboard order per game: (column, True if higher is better)
+RANKINGS = {"game1": ("game1", True), "game2": ("game2_time", False), "game3": ("game3", True)}
+
+# journal mode: saves append one line, compaction folds the journal into scores.db
+USE_JOURNAL = True
+COMPACT_BYTES = 64 * 1024
+STALE_LOCK_SECONDS = 60  # a lock this old was left by a process that died mid compaction
+SCHEMA_VERSION = 2  # kept in meta, _open upgrades older databases once
+
+_conn = None
+_compact_thread = None
+_tail = None
+_tail_key = None
+
+
+def use_dir(path):
+    # point the store at another folder (used by benchmarks)
+    global BASE_DIR, DB_FILE, USERNAME_FILE, JOURNAL_FILE, COMPACTING_FILE, COMPACT_LOCK
+    close()
+    BASE_DIR = path
+    DB_FILE = os.path.join(path, "scores.db")
+    USERNAME_FILE = os.path.join(path, "username.txt")
+    JOURNAL_FILE = os.path.join(path, "scores_journal.txt")
+    COMPACTING_FILE = JOURNAL_FILE + ".compacting"
+    COMPACT_LOCK = JOURNAL_FILE + ".lock"
+
+
+def _open(path):
+    # open a database file and make sure the table exists
+    conn = sqlite3.connect(path)
+    cols = ", ".join(f"{f} INTEGER" for f in FIELDS)
+    conn.execute(f"CREATE TABLE IF NOT EXISTS users (name TEXT PRIMARY KEY, {cols})")
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    # indexes keep every game's ranking sorted on disk, updated on each write
+    # (name breaks ties, so pages of a ranking always come back in the same order)
+    for column, high_first in RANKINGS.values():
+        order = "DESC" if high_first else "ASC"
+        conn.execute(f"CREATE INDEX IF NOT EXISTS rank_{column}_name ON users ({column} {order}, name)")
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+    if row is None or int(row[0]) < SCHEMA_VERSION:
+        # version 2: the ranking indexes gained the name column, drop the old ones once
+        for column, high_first in RANKINGS.values():
+            conn.execute(f"DROP INDEX IF EXISTS rank_{column}")
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+    conn.commit()
+    return conn
+
+
+def connect():
+    # open the score database, import old file first time
+    global _conn
+    if _conn is not None:
+        return _conn
+    is_new = not os.path.exists(DB_FILE)
+    _conn = _open(DB_FILE)
+    if is_new and os.path.exists(USERNAME_FILE):
+        import_text_file(USERNAME_FILE)
+    return _conn
+
+
+def close():
+    # close the shared connection, after letting a running compaction finish
+    # (a daemon thread killed at exit would leave its lock behind)
+    global _conn, _tail_key
+    if _compact_thread is not None:
+        _compact_thread.join()
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+        _tail_key = None
+
+
+# games just exit, so wait for the compaction there too (os._exit callers must call close)
+atexit.register(close)
+
+
+def parse_line(line):
+    # turn "name:k=v,k=v" into (name, dict), return None for junk lines
+    line = line.strip().lstrip("/\\")
+    if not line:
+        return None
+    if ":" not in line:
+        return line, {}
+    name, rest = line.split(":", 1)
+    pairs = {}
+    for part in rest.split(","):
+        if "=" in part:
+            k, v = part.split("=", 1)
+            pairs[k.strip()] = v.strip()
+    return name.strip(), pairs
+
+
+def import_text_file(path=None):
+    # one time import of the old username.txt format, returns users imported
+    # this is also the migration that strips stray leading slashes from names
+    conn = connect()
+    rows = []
+    with open(path or USERNAME_FILE, "r", encoding="utf-8") as f:
+        for line in f:
+            parsed = parse_line(line)
+            if not parsed or not parsed[0]:
+                continue
+            name, pairs = parsed
+            row = [name]
+            for field in FIELDS:
+                try:
+                    row.append(int(pairs[field]) if field in pairs else None)
+                except ValueError:
+                    row.append(0)
+            rows.append(row)
+    marks = ", ".join("?" for _ in range(len(FIELDS) + 1))
+    with conn:
+        conn.executemany(f"INSERT OR REPLACE INTO users (name, {', '.join(FIELDS)}) VALUES ({marks})", rows)
+        if rows:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_user', ?)", (rows[-1][0],))
+    return len(rows)
+
+
+def merge_result(existing, record):
+    # fold one game result into a user's fields, keeping the best values
+    out = dict(existing)
+    for game in ("game1", "game3"):
+        if game in record:
+            prev = out.get(game, 0)
+            if record[game] > prev:
+                out[game] = record[game]
+                out[f"{game}_time"] = record[f"{game}_time"]
+            else:
+                out.setdefault(game, prev)
+                out.setdefault(f"{game}_time", record[f"{game}_time"])
+    if "game2_score" in record:
+        out["game2_score"] = max(record["game2_score"], out.get("game2_score", 0))
+    if "game2_time" in record:
+        prev_time = out.get("game2_time")
+        if prev_time is None or record["game2_time"] < prev_time:
+            out["game2_time"] = record["game2_time"]
+            out["game2_grid"] = record["game2_grid"]
+            out["game2_mines"] = record["game2_mines"]
+        else:
+            out.setdefault("game2_grid", record["game2_grid"])
+            out.setdefault("game2_mines", record["game2_mines"])
+    return out
+
+
+def read_journal(path=None, offset=0):
+    # read journal records from offset, returns ([(name, record)], end offset)
+    # a half written last line (no newline) is left for the next read
+    path = path or JOURNAL_FILE
+    records = []
+    if not os.path.exists(path):
+        return records, offset
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            offset += len(raw)
+            parsed = parse_line(raw.decode("utf-8", "replace"))
+            if not parsed:
+                continue
+            name, pairs = parsed
+            try:
+                records.append((name, {k: int(v) for k, v in pairs.items()}))
+            except ValueError:
+                continue
+    return records, offset
+
+
+def journal_tail():
+    # merged journal records per user that are not in scores.db yet
+    users = {}
+    for path in (COMPACTING_FILE, JOURNAL_FILE):
+        for name, record in read_journal(path)[0]:
+            users[name] = merge_result(users.get(name, {}), record)
+    return users
+
+
+def _db_user(name, conn):
+    row = conn.execute(f"SELECT {', '.join(FIELDS)} FROM users WHERE name = ?", (name,)).fetchone()
+    if row is None:
+        return None
+    return {f: v for f, v in zip(FIELDS, row) if v is not None}
+
+
+def get_user(name):
+    # return dict of saved fields for one user (missing ones left out)
+    user = _db_user(name, connect()) or {}
+    if USE_JOURNAL:
+        for path in (COMPACTING_FILE, JOURNAL_FILE):
+            for rec_name, record in read_journal(path)[0]:
+                if rec_name == name:
+                    user = merge_result(user, record)
+    return user
+
+
+def _write_user(name, values, conn):
+    # insert or update just this user's row
+    sets = ", ".join(f"{k} = ?" for k in values)
+    with conn:
+        conn.execute("INSERT OR IGNORE INTO users (name) VALUES (?)", (name,))
+        if values:
+            conn.execute(f"UPDATE users SET {sets} WHERE name = ?", (*values.values(), name))
+
+
+def _renamed(f):
+    # True if compaction renamed the journal away while f had it open
+    try:
+        current = os.stat(JOURNAL_FILE)
+    except FileNotFoundError:
+        return True
+    return not os.path.samestat(os.fstat(f.fileno()), current)
+
+
+def _append_journal(name, record):
+    # O(1) save: add one line to the journal, compact in background when big
+    rest = ",".join(f"{k}={int(v)}" for k, v in record.items())
+    while True:
+        with open(JOURNAL_FILE, "a", encoding="utf-8") as f:
+            f.write(f"{name}:{rest}\n")
+            f.flush()
+            size = f.tell()
+            # if the file was renamed under us the compactor may have read it before
+            # this line landed, so write it again to the new journal (replays are harmless)
+            moved = _renamed(f)
+        if not moved:
+            break
+    if size >= COMPACT_BYTES:
+        compact_in_background()
+
+
+def save_result(name, record):
+    # save one game result for a user
+    if not name:
+        return
+    if USE_JOURNAL:
+        _append_journal(name, record)
+        return
+    conn = connect()
+    existing = _db_user(name, conn) or {}
+    merged = merge_result(existing, record)
+    _write_user(name, {k: v for k, v in merged.items() if existing.get(k) != v}, conn)
+
+
+def _take_lock():
+    # only one process compacts at a time, the lock file exists while it does
+    try:
+        fd = os.open(COMPACT_LOCK, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            if time.time() - os.path.getmtime(COMPACT_LOCK) < STALE_LOCK_SECONDS:
+                return False
+            os.remove(COMPACT_LOCK)
+        except OSError:
+            return False
+        return _take_lock()
+    os.write(fd, str(os.getpid()).encode())
+    os.close(fd)
+    return True
+
+
+def compact():
+    # fold the journal into scores.db, returns number of records folded
+    # (0 without doing anything if another process is already compacting)
+    if not _take_lock():
+        return 0
+    try:
+        return _compact()
+    finally:
+        try:
+            os.remove(COMPACT_LOCK)
+        except OSError:
+            pass
+
+
+def _compact():
+    # the journal is renamed first so saves from other games keep appending safely
+    if not os.path.exists(COMPACTING_FILE):
+        if not os.path.exists(JOURNAL_FILE):
+            return 0
+        os.replace(JOURNAL_FILE, COMPACTING_FILE)
+    records = read_journal(COMPACTING_FILE)[0]
+    conn = _open(DB_FILE)
+    try:
+        users = {}
+        for name, record in records:
+            if name not in users:
+                users[name] = _db_user(name, conn) or {}
+            users[name] = merge_result(users[name], record)
+        with conn:
+            for name, fields in users.items():
+                conn.execute("INSERT OR IGNORE INTO users (name) VALUES (?)", (name,))
+                if fields:
+                    sets = ", ".join(f"{k} = ?" for k in fields)
+                    conn.execute(f"UPDATE users SET {sets} WHERE name = ?", (*fields.values(), name))
+    finally:
+        conn.close()
+    # replaying twice is harmless (best values only), so a crash here is fine
+    os.remove(COMPACTING_FILE)
+    return len(records)
+
+
+def compact_in_background():
+    # run compact on a worker thread unless one is already running
+    global _compact_thread
+    if _compact_thread is not None and _compact_thread.is_alive():
+        return
+    _compact_thread = threading.Thread(target=compact, daemon=True)
+    _compact_thread.start()
+
+
+def register_user(name):
+    # login: add name through the primary key index and remember it as last user
+    if not name:
+        return
+    conn = connect()
+    with conn:
+        conn.execute("INSERT OR IGNORE INTO users (name) VALUES (?)", (name,))
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_user', ?)", (name,))
+
+
+def last_user():
+    # name of the last user who logged in, None if nobody has
+    row = connect().execute("SELECT value FROM meta WHERE key = 'last_user'").fetchone()
+    return row[0] if row else None
+
+
+def ensure_user(name):
+    # add user with no scores if missing
+    save_result(name, {})
+
+
+def save_game1(name, score, game_time):
+    # keep best game1 score and the time it was set
+    save_result(name, {"game1": int(score), "game1_time": int(game_time)})
+
+
+def save_game2_score(name, score):
+    # keep highest game2 win count
+    save_result(name, {"game2_score": int(score)})
+
+
+def save_game2_time(name, elapsed_time, grid_size, num_mines):
+    # keep best (lowest) game2 time with its grid and mines
+    save_result(name, {"game2_time": int(elapsed_time), "game2_grid": int(grid_size), "game2_mines": int(num_mines)})
+
+
+def save_game3(name, score, time_seconds):
+    # keep best game3 score and the time it was set
+    save_result(name, {"game3": int(score), "game3_time": int(time_seconds)})
+
+
+def all_users():
+    # yield (name, dict) for every saved user: snapshot rows plus journal tail
+    tail = journal_tail() if USE_JOURNAL else {}
+    for row in connect().execute(f"SELECT name, {', '.join(FIELDS)} FROM users"):
+        user = {f: v for f, v in zip(FIELDS, row[1:]) if v is not None}
+        if row[0] in tail:
+            user = merge_result(user, tail.pop(row[0]))
+        yield row[0], user
+    for name, user in tail.items():
+        yield name, user
+
+
+def top_scores(game, k=10):
+    # best k users for a game as [(name, dict)], read from the ranking index
+    column, high_first = RANKINGS[game]
+    order = "DESC" if high_first else "ASC"
+    conn = connect()
+    rows = conn.execute(
+        f"SELECT name, {', '.join(FIELDS)} FROM users WHERE {column} IS NOT NULL ORDER BY {column} {order} LIMIT ?",
+        (k,),
+    )
+    best = {row[0]: {f: v for f, v in zip(FIELDS, row[1:]) if v is not None} for row in rows}
+    if USE_JOURNAL:
+        # saves only ever improve a value, so merging the small tail keeps the top k right
+        for name, record in journal_tail().items():
+            if column not in record:
+                continue
+            base = best.get(name)
+            if base is None:
+                base = _db_user(name, conn) or {}
+            best[name] = merge_result(base, record)
+    ranked = sorted(best.items(), key=lambda item: item[1][column], reverse=high_first)
+    return ranked[:k]
+
+
+def _ranking_order(game, reverse):
+    column, high_first = RANKINGS[game]
+    if reverse:
+        high_first = not high_first
+    name_order = "DESC" if reverse else "ASC"
+    return column, f"{column} {'DESC' if high_first else 'ASC'}, name {name_order}"
+
+
+def _file_state(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _rank_key(game, value, name):
+    # sorts like a game's ranking, best first, same tie break on name as the index
+    return (-value if RANKINGS[game][1] else value, name)
+
+
+def _ranking_tail(game):
+    # journal results of a game not folded into scores.db yet, as (sorted keys of the
+    # rows they replace, sorted new keys, {name: merged fields}). pages and counts come
+    # from the index and are corrected with these, reloaded when the journal changes
+    global _tail, _tail_key
+    key = (DB_FILE, game, USE_JOURNAL, _file_state(COMPACTING_FILE), _file_state(JOURNAL_FILE))
+    if key != _tail_key:
+        column = RANKINGS[game][0]
+        conn = connect()
+        old, new, users = [], [], {}
+        for name, record in (journal_tail().items() if USE_JOURNAL else ()):
+            if column not in record:
+                continue
+            base = _db_user(name, conn) or {}
+            users[name] = merge_result(base, record)
+            if column in base:
+                old.append(_rank_key(game, base[column], name))
+            new.append(_rank_key(game, users[name][column], name))
+        _tail = (sorted(old), sorted(new), users)
+        _tail_key = key
+    return _tail
+
+
+def ranking_count(game):
+    # number of users with a result for a game, journal included
+    column = RANKINGS[game][0]
+    old, new, users = _ranking_tail(game)
+    db_count = connect().execute(f"SELECT COUNT(*) FROM users WHERE {column} IS NOT NULL").fetchone()[0]
+    return db_count + len(new) - len(old)
+
+
+def _page(game, offset, count):
+    # best first page. a journal user moves a row by at most len(tail) places, so the
+    # index rows around offset, widened by that, hold the page. each candidate's place
+    # is its position in that window corrected by the tail keys sorting before it
+    old, new, users = _ranking_tail(game)
+    column, order = _ranking_order(game, False)
+    at = FIELDS.index(column) + 1
+    start = max(0, offset - len(new))
+    limit = count + 2 * len(new) + 1
+    rows = connect().execute(
+        f"SELECT name, {', '.join(FIELDS)} FROM users WHERE {column} IS NOT NULL ORDER BY {order} LIMIT ? OFFSET ?",
+        (limit, start),
+    ).fetchall()
+    if not rows:
+        return []
+    keys = [_rank_key(game, row[at], row[0]) for row in rows]
+    # tail users outside the window's key range can't be on the page
+    lo = keys[0] if start else None
+    hi = keys[-1] if len(rows) == limit else None
+
+    def place(k):
+        return start + bisect.bisect_left(keys, k) - bisect.bisect_left(old, k) + bisect.bisect_left(new, k)
+
+    found = []
+    for k, row in zip(keys, rows):
+        if row[0] not in users:
+            found.append((place(k), row[0], {f: v for f, v in zip(FIELDS, row[1:]) if v is not None}))
+    for name, fields in users.items():
+        k = _rank_key(game, fields[column], name)
+        if (lo is None or k >= lo) and (hi is None or k <= hi):
+            found.append((place(k), name, fields))
+    found.sort(key=lambda item: item[0])
+    return [(name, fields) for pos, name, fields in found if offset <= pos < offset + count]
+
+
+def ranking_page(game, offset, count, reverse=False):
+    # count users from position offset of a game's ranking as [(name, dict)], read from
+    # its index with the journal merged in, reverse lists worst first
+    if not reverse:
+        return _page(game, offset, count)
+    total = ranking_count(game)
+    start = max(0, total - offset - count)
+    return _page(game, start, total - offset - start)[::-1] if total > offset else []
+
+
+def ranking_position(game, name, reverse=False):
+    # 0 based position of a user in a game's ranking, None if they have no result
+    column, high_first = RANKINGS[game]
+    old, new, users = _ranking_tail(game)
+    conn = connect()
+    if name in users:
+        value = users[name][column]
+    else:
+        row = conn.execute(f"SELECT {column} FROM users WHERE name = ?", (name,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        value = row[0]
+    better = ">" if high_first else "<"
+    # two range counts on the ranking index: better results, then ties sorted before the name
+    ahead = conn.execute(f"SELECT COUNT(*) FROM users WHERE {column} {better} ?", (value,)).fetchone()[0]
+    ahead += conn.execute(f"SELECT COUNT(*) FROM users WHERE {column} = ? AND name < ?", (value, name)).fetchone()[0]
+    # then swap the rows journal users had for where they are now
+    k = _rank_key(game, value, name)
+    ahead += bisect.bisect_left(new, k) - bisect.bisect_left(old, k)
+    return ranking_count(game) - 1 - ahead if reverse else ahead
+
+
+def benchmark(sizes=(1000, 100000, 1000000)):
+    # compare one save: text rewrite vs sqlite row update vs journal append
+    import tempfile
+    global USE_JOURNAL
+    old = (BASE_DIR, USE_JOURNAL)
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            txt = os.path.join(tmp, "username.txt")
+            with open(txt, "w", encoding="utf-8") as f:
+                for i in range(n):
+                    f.write(f"user{i}:game1={i % 50},game1_time={i % 300}\n")
+            target = f"user{n // 2}"
+
+            # old way: read every line, rewrite whole file
+            start = time.perf_counter()
+            with open(txt, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+            out = []
+            for line in lines:
+                if line.startswith(target + ":"):
+                    out.append(f"{target}:game1=99,game1_time=10\n")
+                else:
+                    out.append(line)
+            with open(txt, "w", encoding="utf-8") as f:
+                f.writelines(out)
+            text_ms = (time.perf_counter() - start) * 1000
+
+            use_dir(tmp)
+            connect()
+            USE_JOURNAL = False
+            start = time.perf_counter()
+            save_game1(target, 100, 12)
+            db_ms = (time.perf_counter() - start) * 1000
+            USE_JOURNAL = True
+            start = time.perf_counter()
+            save_game1(target, 101, 12)
+            journal_ms = (time.perf_counter() - start) * 1000
+            close()
+        print(f"{n:>8} users | text rewrite: {text_ms:9.2f} ms | sqlite: {db_ms:6.2f} ms | journal: {journal_ms:6.2f} ms")
+    use_dir(old[0])
+    USE_JOURNAL = old[1]
+
+
+def benchmark_leaderboard(sizes=(100, 100000, 1000000)):
+    # compare opening the leaderboard: full parse and sort vs top 10 from the index,
+    # each with a 1000 record journal merged in
+    import tempfile
+    old = BASE_DIR
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            use_dir(tmp)
+            marks = ", ".join("?" for _ in range(len(FIELDS) + 1))
+            with connect():
+                connect().executemany(
+                    f"INSERT INTO users (name, {', '.join(FIELDS)}) VALUES ({marks})",
+                    ((f"user{i}", i * 7 % 1000, i % 300, i % 5, i * 13 % 999, 10, 10, i * 3 % 500, i % 200) for i in range(n)),
+                )
+            # plus a journal of recent results not folded in yet
+            for i in range(min(n, 1000)):
+                save_game1(f"user{i * 7919 % n}", i % 1200, 30)
+            start = time.perf_counter()
+            lists = {"game1": [], "game2": [], "game3": []}
+            for name, user in all_users():
+                for game, (column, high_first) in RANKINGS.items():
+                    if column in user:
+                        lists[game].append((name, user[column]))
+            for game, (column, high_first) in RANKINGS.items():
+                lists[game].sort(key=lambda x: x[1], reverse=high_first)
+            full_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            for game in RANKINGS:
+                top_scores(game, 10)
+            top_ms = (time.perf_counter() - start) * 1000
+            # full ranking window: open it (count + first page), jump to the end, find a player
+            start = time.perf_counter()
+            ranking_count("game1")
+            ranking_page("game1", 0, 15)
+            open_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            ranking_page("game1", max(0, n - 15), 15)
+            last_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            ranking_position("game1", f"user{n // 2}")
+            find_ms = (time.perf_counter() - start) * 1000
+            close()
+        print(f"{n:>8} users | parse and sort: {full_ms:9.2f} ms | top 10 index: {top_ms:6.2f} ms | "
+              f"page: open {open_ms:.2f} ms, last {last_ms:.2f} ms, find {find_ms:.2f} ms")
+    use_dir(old)
+
+
+if __name__ == "__main__":
+    # python score_store.py             -> run save benchmark
+    # python score_store.py leaderboard -> run leaderboard benchmark
+    # python score_store.py import      -> import username.txt into scores.db
+    # python score_store.py compact     -> fold the journal into scores.db now
+    if len(sys.argv) > 1 and sys.argv[1] == "import":
+        print(f"imported {import_text_file()} users into {DB_FILE}")
+    elif len(sys.argv) > 1 and sys.argv[1] == "leaderboard":
+        benchmark_leaderboard()
+    elif len(sys.argv) > 1 and sys.argv[1] == "compact":
+        print(f"folded {compact()} journal records into {DB_FILE}")
+    else:
+        benchmark()
@@ -0,0 +1,62 @@
+import tkinter as tk
+
+
+class GameSession:
+    # everything one play-through puts on a Tk master: after callbacks, widgets
+    # and key bindings. close() takes all of it down so nothing is left running or
+    # allocated when the next game starts (images belong to textures.TEXTURES)
+    def __init__(self, master):
+        self.master = master
+        self.afters = set()
+        self.widgets = []
+        self.bindings = []
+        self.closed = False
+
+    def widget(self, widget):
+        # destroyed on close
+        self.widgets.append(widget)
+        return widget
+
+    def after(self, ms, func):
+        # same as master.after, but cancelled on close (also works as a master for FixedLoop)
+        if self.closed:
+            return None
+        handle = None
+
+        def fire():
+            self.afters.discard(handle)
+            func()
+
+        handle = self.master.after(ms, fire)
+        self.afters.add(handle)
+        return handle
+
+    def after_cancel(self, handle):
+        self.afters.discard(handle)
+        self.master.after_cancel(handle)
+
+    def bind(self, widget, sequence, func):
+        funcid = widget.bind(sequence, func)
+        self.bindings.append((widget, sequence, funcid))
+        return funcid
+
+    def close(self):
+        self.closed = True
+        for handle in list(self.afters):
+            try:
+                self.master.after_cancel(handle)
+            except tk.TclError:
+                pass
+        self.afters.clear()
+        for widget, sequence, funcid in self.bindings:
+            try:
+                widget.unbind(sequence, funcid)
+            except tk.TclError:
+                pass
+        self.bindings.clear()
+        for widget in reversed(self.widgets):
+            try:
+                widget.destroy()
+            except tk.TclError:
+                pass
+        self.widgets.clear()
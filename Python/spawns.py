@@ -0,0 +1,119 @@
+import math
+import random
+import time
+
+
+class FreeSpace:
+    # walkable points on a lattice (step px apart) as one byte each, worked out once
+    # per maze by clearing the lattice points inside every wall (inflated by pad, same
+    # test as collision.WallIndex.hit), so building costs the wall area, not a check per point
+    def __init__(self, width, height, margin, step, rects, pad):
+        self.step = step
+        self.margin = margin
+        self.cols = cols = (width - 2 * margin) // step + 1
+        self.rows = rows = (height - 2 * margin) // step + 1
+        self.free = bytearray(b"\x01") * (cols * rows)
+        for x1, y1, x2, y2 in rects:
+            # lattice columns/rows strictly inside the inflated wall
+            c0 = max(0, math.floor((x1 - pad - margin) / step) + 1)
+            c1 = min(cols, math.ceil((x2 + pad - margin) / step))
+            r0 = max(0, math.floor((y1 - pad - margin) / step) + 1)
+            r1 = min(rows, math.ceil((y2 + pad - margin) / step))
+            if c0 < c1:
+                blank = bytes(c1 - c0)
+                for row in range(r0, r1):
+                    self.free[row * cols + c0:row * cols + c1] = blank
+        self.count = self.free.count(1)
+        # lattice cells covered by entities (counts, so overlapping entities are fine)
+        self.taken = {}
+
+    def _cells(self, x, y, radius):
+        step, margin = self.step, self.margin
+        c0 = max(0, int((x - radius - margin) // step))
+        c1 = min(self.cols - 1, int((x + radius - margin) // step) + 1)
+        r0 = max(0, int((y - radius - margin) // step))
+        r1 = min(self.rows - 1, int((y + radius - margin) // step) + 1)
+        for row in range(r0, r1 + 1):
+            for col in range(c0, c1 + 1):
+                yield col, row
+
+    def occupy(self, pos, radius):
+        # mark the area around an entity so later spawns keep clear of it
+        for cell in self._cells(pos[0], pos[1], radius):
+            self.taken[cell] = self.taken.get(cell, 0) + 1
+
+    def release(self, pos, radius):
+        # undo occupy, e.g. when a blob is picked up
+        for cell in self._cells(pos[0], pos[1], radius):
+            n = self.taken.get(cell, 0) - 1
+            if n > 0:
+                self.taken[cell] = n
+            else:
+                self.taken.pop(cell, None)
+
+    def sample(self, ok=None, rnd=random, box=None, tries=64):
+        # uniformly random free point, None if nothing fits. box (x1, y1, x2, y2) limits
+        # the search to where ok can pass (e.g. a ring around the player). random picks
+        # first, then the few points left in the box if they all missed
+        step, margin, cols = self.step, self.margin, self.cols
+        c0, r0, c1, r1 = 0, 0, cols - 1, self.rows - 1
+        if box is not None:
+            c0 = max(c0, math.ceil((box[0] - margin) / step))
+            r0 = max(r0, math.ceil((box[1] - margin) / step))
+            c1 = min(c1, math.floor((box[2] - margin) / step))
+            r1 = min(r1, math.floor((box[3] - margin) / step))
+            if c0 > c1 or r0 > r1:
+                return None
+        free, taken = self.free, self.taken
+        for _ in range(tries):
+            col = rnd.randint(c0, c1)
+            row = rnd.randint(r0, r1)
+            if free[row * cols + col] and (col, row) not in taken:
+                x, y = margin + col * step, margin + row * step
+                if ok is None or ok(x, y):
+                    return [x, y]
+        found = []
+        for row in range(r0, r1 + 1):
+            base = row * cols
+            y = margin + row * step
+            for col in range(c0, c1 + 1):
+                if free[base + col] and (col, row) not in taken:
+                    x = margin + col * step
+                    if ok is None or ok(x, y):
+                        found.append((x, y))
+        return list(rnd.choice(found)) if found else None
+
+
+def benchmark(sizes=(1000, 8000), step=6, spawns=10000):
+    # build time and per-spawn time with game1 style walls, then where ring spawns
+    # (80-120 px from a point, like the orb) land: one count per octant, should be even
+    from collision import grid_walls
+    for size in sizes:
+        walls = grid_walls(size // 79, size // 79)
+        start = time.perf_counter()
+        free = FreeSpace(size, size, 6, step, walls, 6)
+        build_ms = (time.perf_counter() - start) * 1000
+        rnd = random.Random(3)
+        blobs = []
+        start = time.perf_counter()
+        for i in range(spawns):
+            if len(blobs) >= 50:
+                free.release(blobs.pop(0), 12)
+            pos = free.sample(rnd=rnd)
+            free.occupy(pos, 12)
+            blobs.append(pos)
+        spawn_us = (time.perf_counter() - start) * 1e6 / spawns
+        cx = cy = size // 2 - 26
+        octants = [0] * 8
+        start = time.perf_counter()
+        for _ in range(2000):
+            x, y = free.sample(lambda x, y: 80 <= math.hypot(x - cx, y - cy) <= 120, rnd,
+                               (cx - 120, cy - 120, cx + 120, cy + 120))
+            octants[int((math.atan2(y - cy, x - cx) + math.pi) / (math.pi / 4)) % 8] += 1
+        ring_us = (time.perf_counter() - start) * 1e6 / 2000
+        print(f"{size}px: {free.count} free points in {len(free.free) // 1024} KB, built in {build_ms:.1f} ms, "
+              f"{spawn_us:.2f} us per spawn, {ring_us:.1f} us per ring spawn, octants {octants}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,185 @@
+import math
+import time
+
+# every pixel in a row string is "#rrggbb " (8 chars), so pixel x starts at x * PIXEL
+PIXEL = 8
+
+
+def image_rows(photo):
+    # decode a tk.PhotoImage once into one "#rrggbb #rrggbb ..." string per row
+    data = photo.tk.call(photo.name, "data")
+    rows = []
+    for row in photo.tk.splitlist(data):
+        pixels = photo.tk.splitlist(row)
+        rows.append(" ".join(pixels) + " ")
+    return rows
+
+
+def circle_spans(radius):
+    # half width of the circle for each dy in -radius..radius
+    return [math.isqrt(radius * radius - dy * dy) for dy in range(-radius, radius + 1)]
+
+
+class Spotlight:
+    # blends the light texture inside a circle with the background texture
+    # around it, for a whole rectangle at once, as one PhotoImage.put string
+    def __init__(self, bg_rows, light_rows, width, height, radius):
+        self.bg_rows = bg_rows
+        self.light_rows = light_rows
+        # never read past the smaller texture
+        self.width = min(width, len(bg_rows[0]) // PIXEL, len(light_rows[0]) // PIXEL)
+        self.height = min(height, len(bg_rows), len(light_rows))
+        self.set_radius(radius)
+        # what was lit last frame (centre and circle) and how much each frame touches
+        self.prev_center = None
+        self.prev_spans = self.spans
+        self.last_pixels = 0
+        self.total_pixels = 0
+        self.frames = 0
+        self.puts = 0
+
+    def set_radius(self, radius):
+        self.radius = radius
+        self.spans = circle_spans(radius)
+
+    def bounds(self, cx, cy):
+        # square around the light, clipped to the image: (x0, y0, x1, y1), end exclusive
+        r = self.radius
+        return (max(cx - r, 0), max(cy - r, 0), min(cx + r + 1, self.width), min(cy + r + 1, self.height))
+
+    def compose(self, cx, cy, rect=None):
+        # build put data for rect (default: the light's bounds)
+        x0, y0, x1, y1 = rect or self.bounds(cx, cy)
+        r = self.radius
+        spans = self.spans
+        bg_rows = self.bg_rows
+        light_rows = self.light_rows
+        rows = []
+        for y in range(y0, y1):
+            bg = bg_rows[y]
+            dy = y - cy
+            if -r <= dy <= r:
+                half = spans[dy + r]
+                lx0 = max(cx - half, x0)
+                lx1 = min(cx + half + 1, x1)
+            else:
+                lx0 = lx1 = x0
+            if lx0 < lx1:
+                row = bg[x0 * PIXEL:lx0 * PIXEL] + light_rows[y][lx0 * PIXEL:lx1 * PIXEL] + bg[lx1 * PIXEL:x1 * PIXEL]
+            else:
+                row = bg[x0 * PIXEL:x1 * PIXEL]
+            rows.append("{" + row + "}")
+        return " ".join(rows)
+
+    def draw(self, photo, cx, cy, rect=None):
+        # composite and push to the image in one put call, returns pixels written
+        rect = rect or self.bounds(cx, cy)
+        if rect[0] >= rect[2] or rect[1] >= rect[3]:
+            return 0
+        photo.put(self.compose(cx, cy, rect), to=(rect[0], rect[1]))
+        return (rect[2] - rect[0]) * (rect[3] - rect[1])
+
+    def row_span(self, cx, cy, y, spans=None):
+        # light pixels on row y as (x0, x1), end exclusive, x0 >= x1 if none
+        spans = spans or self.spans
+        r = len(spans) // 2
+        dy = y - cy
+        if not -r <= dy <= r:
+            return 0, 0
+        half = spans[dy + r]
+        return max(cx - half, 0), min(cx + half + 1, self.width)
+
+    def changed_rect(self, px, py, old_spans, cx, cy):
+        # bounding box of the pixels that differ between the light at (px, py) with
+        # old_spans and the current one, as (x0, y0, x1, y1), None if nothing changed.
+        # per row only the ends of the two spans differ, so a small move keeps it tight
+        y0 = max(min(py - len(old_spans) // 2, cy - self.radius), 0)
+        y1 = min(max(py + len(old_spans) // 2, cy + self.radius) + 1, self.height)
+        left, top, right, bottom = self.width, None, 0, 0
+        for y in range(y0, y1):
+            a0, a1 = self.row_span(px, py, y, old_spans)
+            b0, b1 = self.row_span(cx, cy, y)
+            if a0 < a1 and b0 < b1:
+                if a0 == b0 and a1 == b1:
+                    continue
+                lo = min(a0, b0) if a0 != b0 else min(a1, b1)
+                hi = max(a1, b1) if a1 != b1 else max(a0, b0)
+            elif a0 < a1:
+                lo, hi = a0, a1
+            elif b0 < b1:
+                lo, hi = b0, b1
+            else:
+                continue
+            left = min(left, lo)
+            right = max(right, hi)
+            if top is None:
+                top = y
+            bottom = y + 1
+        if top is None:
+            return None
+        return left, top, right, bottom
+
+    def update(self, photo, cx, cy):
+        # redraw only around the pixels that change: the rows where the old circle and
+        # the new one differ, composited from both textures and sent as one put
+        prev = self.prev_center
+        rect = None
+        if prev is None:
+            rect = self.bounds(cx, cy)
+        elif prev != (cx, cy) or self.prev_spans is not self.spans:
+            rect = self.changed_rect(prev[0], prev[1], self.prev_spans, cx, cy)
+        pixels = self.draw(photo, cx, cy, rect) if rect else 0
+        if pixels:
+            self.puts += 1
+        self.prev_center = (cx, cy)
+        self.prev_spans = self.spans
+        self.last_pixels = pixels
+        self.total_pixels += pixels
+        self.frames += 1
+        return pixels
+
+    def average_pixels(self):
+        return self.total_pixels / self.frames if self.frames else 0
+
+
+def benchmark(radii=(6, 50, 100, 150), size=1000, frames=200):
+    # time one frame of compositing at several radii (the put itself needs a display)
+    from textures import noise_rows
+    bg = noise_rows(size, size, 1)
+    light = noise_rows(size, size, 2)
+    for r in radii:
+        spot = Spotlight(bg, light, size, size, r)
+        start = time.perf_counter()
+        for i in range(frames):
+            spot.compose(size // 2 + i % 50, size // 2)
+        ms = (time.perf_counter() - start) * 1000 / frames
+        print(f"radius {r:>3}: {ms:6.2f} ms per frame")
+
+
+class _NullPhoto:
+    # stands in for a PhotoImage when there is no display
+    def put(self, data, to=None):
+        pass
+
+
+def benchmark_dirty(size=1000, radius=100, frames=300):
+    # pixels put per frame while the light moves at different speeds
+    # (counted, not timed: the put itself needs a display)
+    from textures import noise_rows
+    bg = noise_rows(size, size, 1)
+    light = noise_rows(size, size, 2)
+    photo = _NullPhoto()
+    for speed in (0, 1, 4, 50, 300):
+        spot = Spotlight(bg, light, size, size, radius)
+        x = radius
+        for i in range(frames):
+            spot.update(photo, x, size // 2)
+            x = radius + (x - radius + speed) % (size - 2 * radius)
+        puts = spot.puts / spot.frames
+        print(f"speed {speed:>3} px/frame: {spot.average_pixels():9.0f} pixels in {puts:5.1f} puts per frame "
+              f"(screen {size * size})")
+
+
+if __name__ == "__main__":
+    benchmark()
+    benchmark_dirty()
@@ -0,0 +1,108 @@
+import os
+import random
+import time
+import tkinter as tk
+
+from spotlight import PIXEL, image_rows
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# "#rrggbb " for every grey level, noise rows are joined from these
+_GREYS = ["#%02x%02x%02x " % (v, v, v) for v in range(256)]
+
+
+def noise_rows(width, height, seed=None, peak=125):
+    # grey noise like the shipped textures: mostly dark, cubed so bright specks are rare
+    rnd = random.Random(seed)
+    levels = bytes(int(peak * (v / 255) ** 3) for v in range(256))
+    greys = [_GREYS[v] for v in levels]
+    return ["".join([greys[b] for b in rnd.randbytes(width)]) for _ in range(height)]
+
+
+class TextureCache:
+    # textures decoded once per process and kept as the compositor's row strings
+    # ("#rrggbb " per pixel, see spotlight.PIXEL). the PhotoImages belong to the cache,
+    # not to a game session, so a restart gets the same images back instead of
+    # reading the PNGs again. a new Tk root only needs its images rebuilt from the rows
+    def __init__(self):
+        self.rows = {}
+        self.photos = {}
+        self.decodes = 0
+        self.generated = 0
+        self.photos_made = 0
+        self.hits = 0
+
+    def _photo(self, master, key):
+        # the cached image if it still exists in this Tk interpreter
+        photo = self.photos.get(key)
+        if photo is None or photo.tk is not master.tk:
+            return None
+        try:
+            photo.tk.call("image", "width", photo.name)
+        except tk.TclError:
+            return None
+        return photo
+
+    def texture(self, master, filename, width, height, seed=None):
+        # (rows, PhotoImage) of a texture at least width x height: the file if it is
+        # big enough, else noise generated in memory at that size
+        key = (filename, width, height)
+        rows = self.rows.get(key)
+        photo = self._photo(master, key)
+        if rows is not None and photo is not None:
+            self.hits += 1
+            return rows, photo
+        if rows is None:
+            path = os.path.join(BASE_DIR, filename)
+            if os.path.exists(path):
+                photo = tk.PhotoImage(master=master, file=path)
+                if photo.width() >= width and photo.height() >= height:
+                    rows = image_rows(photo)
+                    self.decodes += 1
+                else:
+                    photo.tk.call("image", "delete", photo.name)
+                    photo = None
+            if rows is None:
+                rows = noise_rows(width, height, seed)
+                self.generated += 1
+            self.rows[key] = rows
+        if photo is None:
+            photo = tk.PhotoImage(master=master, width=len(rows[0]) // PIXEL, height=len(rows))
+            photo.put(" ".join("{" + row + "}" for row in rows))
+        self.photos_made += 1
+        self.photos[key] = photo
+        return rows, photo
+
+    def canvas(self, master, name, width, height):
+        # a blank image to draw into, the same one every game
+        key = (name, width, height)
+        photo = self._photo(master, key)
+        if photo is None:
+            photo = tk.PhotoImage(master=master, width=width, height=height)
+            self.photos[key] = photo
+            self.photos_made += 1
+        else:
+            photo.blank()
+            self.hits += 1
+        return photo
+
+    def stats_text(self):
+        return (f"{self.decodes} decoded, {self.generated} generated, {self.photos_made} images made, "
+                f"{self.hits} reused")
+
+
+# one cache for the whole process
+TEXTURES = TextureCache()
+
+
+def benchmark(sizes=(1000, 2000, 4000)):
+    # cost of making noise textures in memory (the image put itself needs a display)
+    for size in sizes:
+        start = time.perf_counter()
+        rows = noise_rows(size, size, 1)
+        ms = (time.perf_counter() - start) * 1000
+        print(f"{size}x{size} noise: {ms:.0f} ms, {sum(map(len, rows)) // 1024 // 1024} MB of rows")
+
+
+if __name__ == "__main__":
+    benchmark()